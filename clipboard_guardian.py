@@ -1,16 +1,23 @@
+import array
 import base64
+import functools
+import hashlib
+import itertools
 import math
 import json
 import os
+import pickle
 import re
 import shutil
 import string
 import sys
 import time
-from dataclasses import dataclass, asdict, field
+import weakref
+from dataclasses import dataclass, asdict, field, fields
 from io import BytesIO
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import ctypes
 import ctypes.wintypes as wintypes
@@ -20,6 +27,11 @@ from PySide6 import QtCore, QtGui, QtWidgets
 import qrcode
 from cryptography.fernet import Fernet
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 APP_NAME = "ClipD"
 APP_DISPLAY_NAME = "ClipD"
@@ -27,6 +39,15 @@ HISTORY_FILE_NAME = "history.bin"
 KEY_FILE_NAME = "key.bin"
 SETTINGS_FILE_NAME = "settings.json"
 MAX_HISTORY_ITEMS = 200
+# upper bound for captured text/html; characters are capped at half of it (UTF-16 worst case)
+MAX_ITEM_BYTES = 1 << 20
+# history.bin is an append-only log of individually encrypted records
+HISTORY_LOG_MAGIC = b"CLIPDLOG1\n"
+# rewrite the log once it carries this many records that are no longer in use
+HISTORY_COMPACT_THRESHOLD = 100
+# break opportunity for long unbroken runs in QLabel previews
+_WRAP_RE = re.compile(r"(\S{60})")
+_ZWS = "\u200b"
 
 OVERLAY_THEMES = ("classic", "glass", "minimal")
 
@@ -48,6 +69,39 @@ def decode_bytes_to_text(payload: bytes) -> str:
     return payload.decode("utf-8", errors="replace")
 
 
+def _json_dumps(data, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(payload: bytes):
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode("utf-8"))
+
+
+class _RecordUnpickler(pickle.Unpickler):
+    """Unpickler for history records, which only ever hold builtin containers and scalars."""
+
+    def find_class(self, module: str, name: str):
+        raise pickle.UnpicklingError(f"unexpected global {module}.{name} in history record")
+
+
+def _encode_record_payload(item: dict) -> bytes:
+    return b"P" + pickle.dumps(item, protocol=5)
+
+
+def _decode_record_payload(payload: bytes) -> dict:
+    tag = payload[:1]
+    if tag == b"P":
+        return _RecordUnpickler(BytesIO(payload[1:])).load()
+    if tag == b"J":
+        return _json_loads(payload[1:])
+    # untagged JSON records from before the pickle format
+    return _json_loads(payload)
+
+
 class Theme:
     PRIMARY_BG = QtGui.QColor("#12131c")
     CARD_BG = QtGui.QColor("#1e2130")
@@ -60,12 +114,8 @@ class Theme:
 
     @classmethod
     def apply_settings(cls, settings: "AppSettings") -> None:
-        cls.ACCENT_GRADIENT_START = QtGui.QColor(settings.accent_start)
-        if not cls.ACCENT_GRADIENT_START.isValid():
-            cls.ACCENT_GRADIENT_START = QtGui.QColor("#7f5af0")
-        cls.ACCENT_GRADIENT_END = QtGui.QColor(settings.accent_end)
-        if not cls.ACCENT_GRADIENT_END.isValid():
-            cls.ACCENT_GRADIENT_END = QtGui.QColor("#2cb67d")
+        cls.ACCENT_GRADIENT_START = settings.accent_start_qcolor()
+        cls.ACCENT_GRADIENT_END = settings.accent_end_qcolor()
         cls.ACCENT = cls.ACCENT_GRADIENT_START
         cls.configure_palette(settings)
 
@@ -86,8 +136,216 @@ class Theme:
 
 
 def color_to_rgba(color: QtGui.QColor, alpha: float) -> str:
+    return _rgba_string(color.rgb(), round(alpha, 3))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_color(value: str, default: str) -> QtGui.QColor:
+    """``value`` as a color, or ``default`` if it does not parse. Shared: copy before modifying."""
+    color = QtGui.QColor(value)
+    return color if color.isValid() else QtGui.QColor(default)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_color(value: str, default: str) -> str:
+    color = QtGui.QColor(value)
+    return color.name() if color.isValid() else default
+
+
+@functools.lru_cache(maxsize=256)
+def _rgba_string(rgb: int, alpha: float) -> str:
     alpha = clamp(alpha, 0.0, 1.0)
-    return f"rgba({color.red()},{color.green()},{color.blue()},{int(alpha * 255)})"
+    return f"rgba({(rgb >> 16) & 0xFF},{(rgb >> 8) & 0xFF},{rgb & 0xFF},{int(alpha * 255)})"
+
+
+_GLOBAL_STYLESHEET_TEMPLATE = string.Template(
+    """
+QWidget {
+    background-color: $base;
+    color: $text;
+}
+QLineEdit, QTextEdit {
+    background-color: $card;
+    border: 1px solid $border;
+    border-radius: 10px;
+    padding: 8px 12px;
+    selection-background-color: $accent;
+}
+QLineEdit:focus {
+    border: 1px solid $accent;
+}
+QListWidget {
+    background: transparent;
+    border: none;
+}
+QPushButton {
+    background-color: $accent_018;
+    border: 1px solid $accent_035;
+    border-radius: 12px;
+    padding: 8px 16px;
+    font-weight: 600;
+    color: $text;
+}
+QPushButton:hover {
+    background-color: $hover_024;
+    border: 1px solid $hover_055;
+}
+QPushButton:pressed {
+    background-color: $pressed_050;
+}
+QToolButton {
+    color: $text;
+    border-radius: 10px;
+    padding: 6px 12px;
+    background-color: $accent_012;
+    border: 1px solid $accent_028;
+}
+QToolButton:hover {
+    background-color: $hover_018;
+    border: 1px solid $hover_045;
+}
+QFrame#titleBar {
+    background-color: $title_bar_bg;
+    border-radius: 14px;
+    border: 1px solid $accent_035;
+}
+QLabel#titleBarLabel {
+    color: $title_text;
+    font-size: 12px;
+    font-weight: 600;
+    letter-spacing: 0.4px;
+    text-transform: uppercase;
+}
+QPushButton[accent="true"] {
+    background-color: $accent_080;
+    border: 1px solid $accent_095;
+    color: #f5f7ff;
+}
+QPushButton[accent="true"]:hover {
+    background-color: $hover_090;
+}
+QPushButton[destructive="true"] {
+    background-color: rgba(255, 99, 71, 0.18);
+    border: 1px solid rgba(255, 99, 71, 0.5);
+    color: rgba(255, 143, 119, 0.95);
+}
+QPushButton[destructive="true"]:hover {
+    background-color: rgba(255, 99, 71, 0.28);
+    border: 1px solid rgba(255, 99, 71, 0.65);
+}
+QScrollBar:vertical {
+    background: transparent;
+    width: 12px;
+    margin: 8px;
+}
+QScrollBar::handle:vertical {
+    background: $accent_050;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QFrame#historyHeader {
+    border-radius: 20px;
+    padding: 1px;
+    background: transparent;
+}
+QFrame#historyHeaderInner {
+    background-color: $history_inner_bg;
+    border-radius: 18px;
+}
+QFrame#historyListContainer {
+    background-color: $history_list_bg;
+    border-radius: 18px;
+    border: 1px solid $history_list_border;
+}
+QLabel#historyTitle {
+    font-size: 22px;
+    font-weight: 700;
+    letter-spacing: 0.5px;
+    color: $history_title;
+    background-color: transparent;
+}
+QLabel#historyStats {
+    font-size: 12px;
+    color: $history_stats;
+    background-color: transparent;
+}
+QLabel#historyEmptyState {
+    color: $history_empty;
+    font-size: 13px;
+    padding: 40px 0;
+}
+QLabel#heroTitle {
+    font-size: 20px;
+    font-weight: 700;
+    color: $hero_title;
+    background-color: transparent;
+}
+QLabel#heroCaption {
+    font-size: 12px;
+    color: $hero_caption;
+    background-color: transparent;
+}
+QLabel#featureLabel {
+    font-size: 12px;
+    color: $hero_features;
+    background-color: transparent;
+}
+QLabel#statusChip {
+    border-radius: 12px;
+    padding: 6px 12px;
+    background-color: rgba(44, 182, 125, 70);
+    color: rgba(44, 182, 125, 210);
+    font-weight: 600;
+    letter-spacing: 0.5px;
+}
+"""
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _global_stylesheet(
+    accent_rgb: int,
+    base_hex: str,
+    card_hex: str,
+    text_hex: str,
+    border_hex: str,
+    dark_mode: bool,
+) -> str:
+    accent = QtGui.QColor.fromRgb(accent_rgb)
+    accent_hover = accent.lighter(125)
+    accent_pressed = accent.darker(120)
+    title_bar_bg = color_to_rgba(QtGui.QColor(24, 26, 40) if dark_mode else QtGui.QColor(247, 248, 255), 0.92)
+    return _GLOBAL_STYLESHEET_TEMPLATE.substitute(
+        base=base_hex,
+        card=card_hex,
+        text=text_hex,
+        border=border_hex,
+        accent=accent.name(),
+        accent_012=color_to_rgba(accent, 0.12),
+        accent_018=color_to_rgba(accent, 0.18),
+        accent_028=color_to_rgba(accent, 0.28),
+        accent_035=color_to_rgba(accent, 0.35),
+        accent_050=color_to_rgba(accent, 0.5),
+        accent_080=color_to_rgba(accent, 0.8),
+        accent_095=color_to_rgba(accent, 0.95),
+        hover_018=color_to_rgba(accent_hover, 0.18),
+        hover_024=color_to_rgba(accent_hover, 0.24),
+        hover_045=color_to_rgba(accent_hover, 0.45),
+        hover_055=color_to_rgba(accent_hover, 0.55),
+        hover_090=color_to_rgba(accent_hover, 0.9),
+        pressed_050=color_to_rgba(accent_pressed, 0.5),
+        title_bar_bg=title_bar_bg,
+        title_text="rgba(245, 247, 255, 230)" if dark_mode else "rgba(36, 38, 58, 230)",
+        history_inner_bg="rgba(18, 19, 28, 220)" if dark_mode else "rgba(247, 248, 255, 235)",
+        history_list_bg="rgba(18, 19, 28, 210)" if dark_mode else "rgba(255, 255, 255, 235)",
+        history_list_border=color_to_rgba(accent, 0.25 if dark_mode else 0.3),
+        history_title="#f5f7ff" if dark_mode else "#1f2338",
+        history_stats="rgba(245, 247, 255, 160)" if dark_mode else "rgba(70, 75, 95, 200)",
+        history_empty="rgba(154, 163, 192, 180)" if dark_mode else "rgba(110, 118, 140, 200)",
+        hero_title="#f5f7ff" if dark_mode else "#1f2238",
+        hero_caption="rgba(245, 247, 255, 150)" if dark_mode else "rgba(70, 75, 95, 190)",
+        hero_features="rgba(245, 247, 255, 190)" if dark_mode else "rgba(54, 59, 80, 200)",
+    )
 
 
 def apply_app_theme(app: QtWidgets.QApplication, settings: "AppSettings") -> None:
@@ -115,106 +373,17 @@ def apply_app_theme(app: QtWidgets.QApplication, settings: "AppSettings") -> Non
     font = QtGui.QFont("Segoe UI", 10)
     app.setFont(font)
 
-    accent = Theme.ACCENT
-    accent_hover = QtGui.QColor(accent)
-    accent_hover = accent_hover.lighter(125)
-    accent_pressed = QtGui.QColor(accent)
-    accent_pressed = accent_pressed.darker(120)
-
-    base_hex = Theme.PRIMARY_BG.name()
-    card_hex = Theme.CARD_BG.name()
-    text_hex = Theme.TEXT_PRIMARY.name()
-    border_hex = Theme.BORDER.name()
-    muted_hex = Theme.TEXT_MUTED.name()
-    title_bar_bg = color_to_rgba(QtGui.QColor(24, 26, 40) if settings.theme_mode == "dark" else QtGui.QColor(247, 248, 255), 0.92)
-    title_text = "rgba(245, 247, 255, 230)" if settings.theme_mode == "dark" else "rgba(36, 38, 58, 230)"
-
-    global_stylesheet = f"""
-    QWidget {{
-        background-color: {base_hex};
-        color: {text_hex};
-    }}
-    QLineEdit, QTextEdit {{
-        background-color: {card_hex};
-        border: 1px solid {border_hex};
-        border-radius: 10px;
-        padding: 8px 12px;
-        selection-background-color: {accent.name()};
-    }}
-    QLineEdit:focus {{
-        border: 1px solid {accent.name()};
-    }}
-    QListWidget {{
-        background: transparent;
-        border: none;
-    }}
-    QPushButton {{
-        background-color: {color_to_rgba(accent, 0.18)};
-        border: 1px solid {color_to_rgba(accent, 0.35)};
-        border-radius: 12px;
-        padding: 8px 16px;
-        font-weight: 600;
-        color: {text_hex};
-    }}
-    QPushButton:hover {{
-        background-color: {color_to_rgba(accent_hover, 0.24)};
-        border: 1px solid {color_to_rgba(accent_hover, 0.55)};
-    }}
-    QPushButton:pressed {{
-        background-color: {color_to_rgba(accent_pressed, 0.5)};
-    }}
-    QToolButton {{
-        color: {text_hex};
-        border-radius: 10px;
-        padding: 6px 12px;
-        background-color: {color_to_rgba(accent, 0.12)};
-        border: 1px solid {color_to_rgba(accent, 0.28)};
-    }}
-    QToolButton:hover {{
-        background-color: {color_to_rgba(accent_hover, 0.18)};
-        border: 1px solid {color_to_rgba(accent_hover, 0.45)};
-    }}
-    QFrame#titleBar {{
-        background-color: {title_bar_bg};
-        border-radius: 14px;
-        border: 1px solid {color_to_rgba(accent, 0.35)};
-    }}
-    QLabel#titleBarLabel {{
-        color: {title_text};
-        font-size: 12px;
-        font-weight: 600;
-        letter-spacing: 0.4px;
-        text-transform: uppercase;
-    }}
-    QPushButton[accent="true"] {{
-        background-color: {color_to_rgba(accent, 0.8)};
-        border: 1px solid {color_to_rgba(accent, 0.95)};
-        color: #f5f7ff;
-    }}
-    QPushButton[accent="true"]:hover {{
-        background-color: {color_to_rgba(accent_hover, 0.9)};
-    }}
-    QPushButton[destructive="true"] {{
-        background-color: rgba(255, 99, 71, 0.18);
-        border: 1px solid rgba(255, 99, 71, 0.5);
-        color: rgba(255, 143, 119, 0.95);
-    }}
-    QPushButton[destructive="true"]:hover {{
-        background-color: rgba(255, 99, 71, 0.28);
-        border: 1px solid rgba(255, 99, 71, 0.65);
-    }}
-    QScrollBar:vertical {{
-        background: transparent;
-        width: 12px;
-        margin: 8px;
-    }}
-    QScrollBar::handle:vertical {{
-        background: {color_to_rgba(accent, 0.5)};
-        border-radius: 6px;
-        min-height: 20px;
-    }}
-    """
-    app.setStyleSheet(global_stylesheet)
+    stylesheet = _global_stylesheet(
+        Theme.ACCENT.rgb(),
+        Theme.PRIMARY_BG.name(),
+        Theme.CARD_BG.name(),
+        Theme.TEXT_PRIMARY.name(),
+        Theme.BORDER.name(),
+        settings.theme_mode == "dark",
+    )
+    # Re-setting an identical sheet still makes Qt reparse it and repolish every widget.
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
 
 def app_data_dir() -> Path:
     appdata = os.getenv("APPDATA")
@@ -257,18 +426,30 @@ class AppSettings:
     def to_dict(self) -> dict:
         return asdict(self)
 
+    def accent_start_qcolor(self) -> QtGui.QColor:
+        """Parsed ``accent_start``; the color is shared, copy it before modifying."""
+        return _parse_color(self.accent_start, "#7f5af0")
+
+    def accent_end_qcolor(self) -> QtGui.QColor:
+        """Parsed ``accent_end``; the color is shared, copy it before modifying."""
+        return _parse_color(self.accent_end, "#2cb67d")
+
+    def diff(self, other: "AppSettings") -> set:
+        """Names of the fields whose values differ between ``self`` and ``other``."""
+        return {f.name for f in fields(self) if getattr(self, f.name) != getattr(other, f.name)}
+
     @classmethod
     def load(cls, path: Path) -> "AppSettings":
         if not path.exists():
             return cls()
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _json_loads(path.read_bytes())
             return cls(**data).sanitized()
         except Exception:
             return cls()
 
     def save(self, path: Path) -> None:
-        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        path.write_bytes(_json_dumps(self.to_dict(), indent=True))
 
     def sanitized(self) -> "AppSettings":
         preview_value = self.show_preview_overlay
@@ -298,12 +479,8 @@ class AppSettings:
         sanitized = AppSettings(
             toast_duration_ms=int(clamp(self.toast_duration_ms, 600, 10000)),
             toast_scale=float(clamp(self.toast_scale, 0.6, 1.6)),
-            accent_start=QtGui.QColor(self.accent_start).name()
-            if QtGui.QColor(self.accent_start).isValid()
-            else "#7f5af0",
-            accent_end=QtGui.QColor(self.accent_end).name()
-            if QtGui.QColor(self.accent_end).isValid()
-            else "#2cb67d",
+            accent_start=_normalize_color(self.accent_start, "#7f5af0"),
+            accent_end=_normalize_color(self.accent_end, "#2cb67d"),
             hotkey_next=self.hotkey_next or "Ctrl+Alt+Down",
             hotkey_prev=self.hotkey_prev or "Ctrl+Alt+Up",
             hotkey_show_history=self.hotkey_show_history or "Ctrl+Alt+V",
@@ -332,23 +509,29 @@ class AppSettings:
 DEFAULT_SETTINGS = AppSettings()
 
 
+_HOTKEY_DISPLAY_NAMES = {
+    "Ctrl": "Strg",
+    "Control": "Strg",
+    "Meta": "Win",
+    "Super": "Win",
+    "Return": "Enter",
+}
+_HOTKEY_RE = re.compile("|".join(_HOTKEY_DISPLAY_NAMES))
+
+
+@functools.lru_cache(maxsize=64)
 def display_hotkey(sequence: str) -> str:
-    result = sequence or ""
-    replacements = {
-        "Ctrl": "Strg",
-        "Control": "Strg",
-        "Meta": "Win",
-        "Super": "Win",
-        "Return": "Enter",
-    }
-    for src, dst in replacements.items():
-        result = result.replace(src, dst)
-    return result
+    return _HOTKEY_RE.sub(lambda match: _HOTKEY_DISPLAY_NAMES[match.group()], sequence or "")
+
 class EncryptedStorage:
     def __init__(self, storage_path: Path) -> None:
         self.storage_path = storage_path
         self.key_path = storage_path.with_name(KEY_FILE_NAME)
         self._fernet = Fernet(self._load_or_create_key())
+        # Number of records in the log file; None if it must be rewritten first.
+        self.record_count: Optional[int] = None
+        # save()/append() run on a worker thread
+        self._lock = QtCore.QMutex()
 
     def _load_or_create_key(self) -> bytes:
         if self.key_path.exists():
@@ -358,23 +541,138 @@ class EncryptedStorage:
         return key
 
     def load(self) -> List[dict]:
+        """Return the stored items, newest first."""
+        with QtCore.QMutexLocker(self._lock):
+            return self._load_locked()
+
+    def _load_locked(self) -> List[dict]:
+        self.record_count = None
         if not self.storage_path.exists():
+            self.record_count = 0
             return []
         try:
-            encrypted = self.storage_path.read_bytes()
-            data = self._fernet.decrypt(encrypted)
-            return json.loads(data.decode("utf-8"))
+            data = self.storage_path.read_bytes()
+            if not data.startswith(HISTORY_LOG_MAGIC):
+                # single-token history written by older versions
+                return _json_loads(self._fernet.decrypt(data))
+            tokens, complete = self._split_records(data)
+            items: List[dict] = []
+            for token in tokens:
+                try:
+                    items.append(_decode_record_payload(self._fernet.decrypt(token)))
+                except Exception:
+                    # corrupted record -> keep what was readable
+                    complete = False
+                    break
+            # a torn or corrupted tail has to be rewritten before appending again
+            self.record_count = len(items) if complete else None
+            items.reverse()
+            return items
         except Exception:
             # corrupted history -> start fresh
             return []
 
     def save(self, items: List[dict]) -> None:
-        payload = json.dumps(items, ensure_ascii=False).encode("utf-8")
-        token = self._fernet.encrypt(payload)
-        self.storage_path.write_bytes(token)
+        """Rewrite the whole log from ``items`` (newest first)."""
+        chunks = [HISTORY_LOG_MAGIC]
+        chunks.extend(self._encode_record(item) for item in reversed(items))
+        with QtCore.QMutexLocker(self._lock):
+            self._save_locked(b"".join(chunks), len(items))
+
+    def append(self, items: List[dict]) -> bool:
+        """Store ``items`` (oldest first) as the newest records.
+
+        Older records are left untouched. Returns False without writing if the
+        log has to be rewritten first (``record_count`` is None); the next
+        save() then carries the items.
+        """
+        records = b"".join(self._encode_record(item) for item in items)
+        with QtCore.QMutexLocker(self._lock):
+            if self.record_count is None:
+                return False
+            self._append_locked(records, len(items))
+        return True
+
+    def persist(self, pending: List[dict], items: List[dict], compact: bool) -> None:
+        """Append ``pending`` (oldest first), or rewrite the log from ``items`` (newest first).
+
+        The choice is made under the lock, against the record count left by the
+        previous write: the log is rewritten when ``compact`` is set, when it
+        must be rewritten anyway, or when it has grown too far past ``items``.
+        """
+        with QtCore.QMutexLocker(self._lock):
+            count = self.record_count
+            if (
+                compact
+                or count is None
+                or count + len(pending) - len(items) >= HISTORY_COMPACT_THRESHOLD
+            ):
+                chunks = [HISTORY_LOG_MAGIC]
+                chunks.extend(self._encode_record(item) for item in reversed(items))
+                self._save_locked(b"".join(chunks), len(items))
+            elif pending:
+                records = b"".join(self._encode_record(item) for item in pending)
+                self._append_locked(records, len(pending))
+
+    def _save_locked(self, data: bytes, count: int) -> None:
+        tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
+        try:
+            # write aside and swap in, so a crash never leaves a half-written history
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.storage_path)
+        except Exception:
+            self.record_count = None
+            raise
+        self.record_count = count
 
+    def _append_locked(self, records: bytes, count: int) -> None:
+        try:
+            with self.storage_path.open("ab") as handle:
+                if handle.tell() == 0:
+                    handle.write(HISTORY_LOG_MAGIC)
+                handle.write(records)
+        except Exception:
+            self.record_count = None
+            raise
+        self.record_count += count
 
-@dataclass
+    def _encode_record(self, item: dict) -> bytes:
+        token = self._fernet.encrypt(_encode_record_payload(item))
+        return len(token).to_bytes(4, "little") + token + b"\n"
+
+    @staticmethod
+    def _split_records(data: bytes) -> Tuple[List[bytes], bool]:
+        tokens: List[bytes] = []
+        pos = len(HISTORY_LOG_MAGIC)
+        end = len(data)
+        while pos + 4 <= end:
+            size = int.from_bytes(data[pos:pos + 4], "little")
+            start = pos + 4
+            stop = start + size
+            if stop >= end or data[stop:stop + 1] != b"\n":
+                return tokens, False
+            tokens.append(data[start:stop])
+            pos = stop + 1
+        return tokens, pos == end
+
+
+_item_uids = itertools.count(1)
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def char_mask(text: str) -> int:
+    """64-bit bloom mask of the characters in ``text``.
+
+    If ``char_mask(needle) & ~char_mask(haystack)`` is non-zero, ``needle`` cannot occur in ``haystack``.
+    """
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ClipboardItem:
     content: str
     timestamp: float
@@ -386,6 +684,71 @@ class ClipboardItem:
     pinned: bool = False
     rtf_data: Optional[str] = None
     csv_data: Optional[str] = None
+    # formatted once; the timestamp never changes after capture
+    timestamp_str: str = field(default="", init=False, repr=False, compare=False)
+    # session-unique id; lets views match rows to items without comparing content
+    uid: int = field(default_factory=_item_uids.__next__, init=False, repr=False, compare=False)
+    # persisted form, built once and reused by every later save
+    _record: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # lowercased text the history search matches against, built on first search
+    _search_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _search_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.timestamp_str = time.strftime("%d.%m.%Y %H:%M", time.localtime(self.timestamp))
+
+    def to_dict(self) -> dict:
+        """Return the persisted record; treat it as read-only, it may be shared with the writer thread."""
+        if self._record is None:
+            self._record = self._build_record()
+        return self._record
+
+    def invalidate_cache(self) -> None:
+        """Drop cached derived data after the item was changed in place."""
+        self._record = None
+        self._search_text = None
+        self._search_mask = 0
+
+    @property
+    def search_text(self) -> str:
+        if self._search_text is None:
+            self._build_search_index()
+        return self._search_text
+
+    @property
+    def search_mask(self) -> int:
+        """Character bloom mask of ``search_text`` (see ``char_mask``)."""
+        if self._search_text is None:
+            self._build_search_index()
+        return self._search_mask
+
+    def _build_search_index(self) -> None:
+        parts: List[str] = [self.content]
+        if self.html:
+            doc = QtGui.QTextDocument()
+            doc.setHtml(self.html)
+            parts.append(doc.toPlainText())
+        parts.extend(Path(path_value).name for path_value in self.files)
+        parts.extend(self.urls)
+        if self.format == "image":
+            parts.append("bild")
+        # a search query is a single line, so it can never match across the separator
+        self._search_text = "\n".join(part for part in parts if part).lower()
+        self._search_mask = char_mask(self._search_text)
+
+    def _build_record(self) -> dict:
+        return {
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "html": self.html,
+            "image_data": self.image_data,
+            "urls": list(self.urls),
+            "files": list(self.files),
+            "format": self.format,
+            "pinned": self.pinned,
+            "rtf_data": self.rtf_data,
+            "csv_data": self.csv_data,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ClipboardItem":
@@ -403,9 +766,34 @@ class ClipboardItem:
         )
 
 
+class _PersistTask(QtCore.QRunnable):
+    def __init__(
+        self, storage: EncryptedStorage, pending: List[dict], items: List[dict], compact: bool, failed
+    ) -> None:
+        super().__init__()
+        self._storage = storage
+        self._pending = pending
+        self._items = items
+        self._compact = compact
+        # emitted from the worker thread when the write failed
+        self._failed = failed
+
+    def run(self) -> None:
+        try:
+            self._storage.persist(self._pending, self._items, self._compact)
+        except Exception:
+            self._failed.emit()
+
+
 class ClipboardHistory(QtCore.QObject):
-    historyUpdated = QtCore.Signal(list)
+    # Bulk changes (clear, pin, edit); receivers must treat the list as read-only.
+    historyUpdated = QtCore.Signal(object)
+    # Single-row changes, with the row in display order (pinned first).
+    historyItemAdded = QtCore.Signal(ClipboardItem, int)
+    historyItemRemoved = QtCore.Signal(int)
     selectionChanged = QtCore.Signal(object)
+    # A background write failed or was refused; delivered queued on the GUI thread.
+    _persist_failed = QtCore.Signal()
 
     def __init__(self, clipboard: QtGui.QClipboard, storage: EncryptedStorage) -> None:
         super().__init__()
@@ -414,10 +802,30 @@ class ClipboardHistory(QtCore.QObject):
         self._history: List[ClipboardItem] = [
             ClipboardItem.from_dict(entry) for entry in self._storage.load()
         ]
+        # Display-order view shared with all readers; reset on every structural change.
+        self._history_snapshot: Optional[Tuple[ClipboardItem, ...]] = None
         self._trim_history()
+        self._pending_appends: List[ClipboardItem] = []
+        self._needs_compaction = self._storage.record_count != len(self._history)
         self._current_index: Optional[int] = 0 if self._history else None
         self._suspend_capture = False
-        self._clipboard.dataChanged.connect(self._on_clipboard_change)
+        self._last_hash: bytes = b""
+        self._refresh_last_hash()
+        # Rapid captures are coalesced into a single encrypt + write.
+        self._persist_timer = QtCore.QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(500)
+        self._persist_timer.timeout.connect(self._persist_now)
+        # A single worker keeps appends and rewrites in submission order.
+        self._persist_pool = QtCore.QThreadPool(self)
+        self._persist_pool.setMaxThreadCount(1)
+        self._persist_failed.connect(self._on_persist_failed)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+        if self._needs_compaction:
+            self._persist_timer.start()
+        self._clipboard.dataChanged.connect(self._on_clipboard_change, QtCore.Qt.DirectConnection)
 
     def _on_clipboard_change(self) -> None:
         if self._suspend_capture:
@@ -427,19 +835,49 @@ class ClipboardHistory(QtCore.QObject):
         if not new_item:
             return
 
-        if self._history and self._items_equal(self._ordered_items()[0], new_item):
+        item_hash = self._item_digest(new_item)
+        if item_hash == self._last_hash:
             return
+        self._last_hash = item_hash
 
+        row = sum(1 for item in self._history if item.pinned)
         self._history.insert(0, new_item)
-        self._trim_history()
+        self._history_snapshot = None
+        trimmed = self._trim_history()
         self._current_index = 0
-        self._persist()
-        self.historyUpdated.emit(self.all_items())
+        self._pending_appends.append(new_item)
+        self._persist_timer.start()
+        self.historyItemAdded.emit(new_item, row)
+        # trimmed entries are the oldest unpinned ones, i.e. the last rows
+        for last_row in range(len(self._history) + trimmed - 1, len(self._history) - 1, -1):
+            self.historyItemRemoved.emit(last_row)
         self.selectionChanged.emit(self.current_item())
 
-    def _persist(self) -> None:
-        serializable = [asdict(entry) for entry in self._history]
-        self._storage.save(serializable)
+    def _persist_now(self) -> None:
+        self._persist_timer.stop()
+        pending, self._pending_appends = self._pending_appends, []
+        compact, self._needs_compaction = self._needs_compaction, False
+        # Snapshots are taken here on the GUI thread. Whether to append or rewrite is
+        # decided by the worker under the storage lock, after earlier writes finished.
+        task = _PersistTask(
+            self._storage,
+            [entry.to_dict() for entry in pending],
+            [entry.to_dict() for entry in self._history],
+            compact,
+            self._persist_failed,
+        )
+        self._persist_pool.start(task)
+
+    def _on_persist_failed(self) -> None:
+        # Retry with a full rewrite, so removed entries do not linger on disk.
+        self._needs_compaction = True
+        self._persist_timer.start()
+
+    def flush(self) -> None:
+        """Write a pending, debounced history save and wait until it is on disk."""
+        if self._persist_timer.isActive():
+            self._persist_now()
+        self._persist_pool.waitForDone()
 
     def current_item(self) -> Optional[ClipboardItem]:
         ordered = self._ordered_items()
@@ -458,8 +896,9 @@ class ClipboardHistory(QtCore.QObject):
             self._current_index = 0
         else:
             self._current_index = (self._current_index + 1) % len(ordered)
-        self.selectionChanged.emit(self.current_item())
-        return self.current_item()
+        item = self.current_item()
+        self.selectionChanged.emit(item)
+        return item
 
     def select_previous(self) -> Optional[ClipboardItem]:
         ordered = self._ordered_items()
@@ -469,8 +908,9 @@ class ClipboardHistory(QtCore.QObject):
             self._current_index = 0
         else:
             self._current_index = (self._current_index - 1) % len(ordered)
-        self.selectionChanged.emit(self.current_item())
-        return self.current_item()
+        item = self.current_item()
+        self.selectionChanged.emit(item)
+        return item
 
     def select_index(self, index: int) -> Optional[ClipboardItem]:
         ordered = self._ordered_items()
@@ -478,26 +918,45 @@ class ClipboardHistory(QtCore.QObject):
             return None
         index = max(0, min(index, len(ordered) - 1))
         self._current_index = index
-        self.selectionChanged.emit(self.current_item())
-        return self.current_item()
+        item = self.current_item()
+        self.selectionChanged.emit(item)
+        return item
 
     def remove_entry(self, entry: ClipboardItem) -> None:
         if entry.pinned:
             return
-        if entry not in self._history:
+        idx = self._index_of(entry)
+        if idx is None:
             return
-        for idx, existing in enumerate(self._history):
+        existing = self._history[idx]
+        row = self._index_in(self._ordered_items(), existing)
+        del self._history[idx]
+        self._history_snapshot = None
+        self._refresh_last_hash()
+        self._needs_compaction = True
+        self._persist_timer.start()
+        ordered = self._ordered_items()
+        if not ordered:
+            self._current_index = None
+        else:
+            self._current_index = min(self._current_index or 0, len(ordered) - 1)
+        self.historyItemRemoved.emit(row)
+        self.selectionChanged.emit(self.current_item())
+
+    def _index_of(self, entry: ClipboardItem) -> Optional[int]:
+        return self._index_in(self._history, entry)
+
+    @staticmethod
+    def _index_in(items: Sequence[ClipboardItem], entry: ClipboardItem) -> Optional[int]:
+        # Callers almost always pass the stored object itself; only compare
+        # field by field (content included) when it is a reconstructed copy.
+        for idx, existing in enumerate(items):
+            if existing is entry:
+                return idx
+        for idx, existing in enumerate(items):
             if existing == entry:
-                del self._history[idx]
-                self._persist()
-                ordered = self._ordered_items()
-                if not ordered:
-                    self._current_index = None
-                else:
-                    self._current_index = min(self._current_index or 0, len(ordered) - 1)
-                self.historyUpdated.emit(self.all_items())
-                self.selectionChanged.emit(self.current_item())
-                return
+                return idx
+        return None
 
     def clear(self) -> None:
         if not self._history:
@@ -506,9 +965,12 @@ class ClipboardHistory(QtCore.QObject):
         if len(pinned_items) == len(self._history):
             return
         self._history = pinned_items
+        self._history_snapshot = None
         self._current_index = None
-        self._persist()
-        self.historyUpdated.emit(self.all_items())
+        self._refresh_last_hash()
+        self._needs_compaction = True
+        self._persist_timer.start()
+        self.historyUpdated.emit(self._ordered_items())
         self.selectionChanged.emit(None)
 
     def edit_entry(self, entry: ClipboardItem, new_content: str) -> None:
@@ -516,8 +978,10 @@ class ClipboardHistory(QtCore.QObject):
 
         Keeps the item's position and pinned state; drops non-text payloads.
         """
-        if entry not in self._history:
+        idx = self._index_of(entry)
+        if idx is None:
             return
+        entry = self._history[idx]
         entry.content = new_content or ""
         entry.format = "text"
         entry.html = None
@@ -526,8 +990,11 @@ class ClipboardHistory(QtCore.QObject):
         entry.files = []
         entry.rtf_data = None
         entry.csv_data = None
-        self._persist()
-        self.historyUpdated.emit(self.all_items())
+        entry.invalidate_cache()
+        self._refresh_last_hash()
+        self._needs_compaction = True
+        self._persist_timer.start()
+        self.historyUpdated.emit(self._ordered_items())
         self.selectionChanged.emit(self.current_item())
 
     def push_to_clipboard(self, item: ClipboardItem) -> None:
@@ -577,46 +1044,64 @@ class ClipboardHistory(QtCore.QObject):
     def _resume_capture(self) -> None:
         self._suspend_capture = False
 
-    def all_items(self) -> List[ClipboardItem]:
-        return self._ordered_items().copy()
+    def all_items(self) -> Tuple[ClipboardItem, ...]:
+        return self._ordered_items()
 
     def toggle_pin(self, entry: ClipboardItem) -> None:
-        if entry not in self._history:
+        idx = self._index_of(entry)
+        if idx is None:
             return
+        entry = self._history[idx]
         entry.pinned = not entry.pinned
-        ordered = self._ordered_items()
-        if entry in ordered:
-            self._current_index = ordered.index(entry)
-        self._persist()
-        self.historyUpdated.emit(self.all_items())
+        entry.invalidate_cache()
+        self._history_snapshot = None
+        self._current_index = self._index_in(self._ordered_items(), entry)
+        self._needs_compaction = True
+        self._persist_timer.start()
+        self.historyUpdated.emit(self._ordered_items())
         self.selectionChanged.emit(self.current_item())
 
-    def _ordered_items(self) -> List[ClipboardItem]:
-        pinned = [item for item in self._history if item.pinned]
-        others = [item for item in self._history if not item.pinned]
-        return pinned + others
+    def _ordered_items(self) -> Tuple[ClipboardItem, ...]:
+        if self._history_snapshot is None:
+            pinned = [item for item in self._history if item.pinned]
+            others = [item for item in self._history if not item.pinned]
+            self._history_snapshot = tuple(pinned + others)
+        return self._history_snapshot
 
-    def _trim_history(self) -> None:
+    def _trim_history(self) -> int:
         unpinned = [item for item in self._history if not item.pinned]
+        removed = 0
         while len(unpinned) > MAX_HISTORY_ITEMS:
             to_remove = unpinned.pop()
             try:
                 self._history.remove(to_remove)
             except ValueError:
                 break
+            self._history_snapshot = None
+            removed += 1
+        return removed
 
     def _create_item_from_mime(self, mime: Optional[QtCore.QMimeData]) -> Optional[ClipboardItem]:
         if not mime:
             return None
-        text = mime.text() if mime.hasText() else ""
-        html = mime.html() if mime.hasHtml() else None
-        if (not html or not html.strip()) and mime.hasFormat("text/html"):
+        # Each hasFormat() on the system clipboard asks the OS again; list the formats once.
+        formats = set(mime.formats())
+        has_html = "text/html" in formats
+        text = mime.text() if "text/plain" in formats or "text/uri-list" in formats else ""
+        html = mime.html() if has_html else None
+        if (not html or not html.strip()) and has_html:
             try:
                 raw_html = mime.data("text/html")
                 if raw_html:
                     html = decode_bytes_to_text(bytes(raw_html))
             except Exception:
                 html = html or None
+        max_chars = MAX_ITEM_BYTES // 2
+        if len(text) > max_chars:
+            text = text[:max_chars]
+        if html and len(html) > max_chars:
+            # cut markup would break tags and entities; keep the (capped) plain text instead
+            html = None
         image_data = None
         if mime.hasImage():
             try:
@@ -635,7 +1120,7 @@ class ClipboardHistory(QtCore.QObject):
                 image_data = None
         urls: List[str] = []
         files: List[str] = []
-        if mime.hasUrls():
+        if "text/uri-list" in formats:
             for qurl in mime.urls():
                 if qurl.isLocalFile():
                     files.append(qurl.toLocalFile())
@@ -646,7 +1131,7 @@ class ClipboardHistory(QtCore.QObject):
             'application/x-qt-windows-mime;value="Rich Text Format"',
             'application/x-qt-windows-mime;value="RTF"',
         ):
-            if mime.hasFormat(fmt):
+            if fmt in formats:
                 try:
                     raw_rtf = mime.data(fmt)
                     if raw_rtf:
@@ -661,7 +1146,7 @@ class ClipboardHistory(QtCore.QObject):
             "application/x-qt-windows-mime;value=\"Csv\"",
             "application/x-qt-windows-mime;value=\"CSV\"",
         ):
-            if mime.hasFormat(fmt):
+            if fmt in formats:
                 try:
                     raw_csv = mime.data(fmt)
                     if raw_csv:
@@ -701,26 +1186,141 @@ class ClipboardHistory(QtCore.QObject):
             csv_data=csv_data,
         )
 
-    def _items_equal(self, a: ClipboardItem, b: ClipboardItem) -> bool:
-        if a.format != b.format:
-            return False
-        if a.format == "image":
-            return a.image_data == b.image_data
-        if a.format == "table":
-            return (
-                a.csv_data == b.csv_data
-                and (a.html or "") == (b.html or "")
-                and a.content == b.content
-            )
-        if a.format == "rich":
-            return a.rtf_data == b.rtf_data and a.content == b.content
-        if a.format == "html":
-            return a.html == b.html and a.content == b.content
-        if a.format == "files":
-            return set(a.files) == set(b.files)
-        if a.format == "urls":
-            return set(a.urls) == set(b.urls)
-        return a.content == b.content
+    def _item_digest(self, item: ClipboardItem) -> bytes:
+        """Hash the fields that decide whether two captures are duplicates."""
+        fmt = item.format
+        if fmt == "image":
+            parts = (item.image_data or "",)
+        elif fmt == "table":
+            parts = (item.csv_data or "", item.html or "", item.content)
+        elif fmt == "rich":
+            parts = (item.rtf_data or "", item.content)
+        elif fmt == "html":
+            parts = (item.html or "", item.content)
+        elif fmt == "files":
+            parts = tuple(sorted(set(item.files)))
+        elif fmt == "urls":
+            parts = tuple(sorted(set(item.urls)))
+        else:
+            parts = (item.content,)
+        digest = hashlib.blake2b(fmt.encode("utf-8"), digest_size=16)
+        for part in parts:
+            raw = (part or "").encode("utf-8", "surrogatepass")
+            digest.update(len(raw).to_bytes(8, "little"))
+            digest.update(raw)
+        return digest.digest()
+
+    def _refresh_last_hash(self) -> None:
+        self._last_hash = self._item_digest(self._history[0]) if self._history else b""
+
+
+_TOAST_CARD_TEMPLATE = string.Template(
+    """
+QFrame#toastCard {
+    background-color: $background;
+    border-radius: 16px;
+    border: 1px solid $border;
+}
+"""
+)
+_TOAST_ACCENT_TEMPLATE = string.Template(
+    """
+QLabel {
+    border-radius: 5px;
+    background-color: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 $start, stop:1 $end
+    );
+}
+"""
+)
+_TOAST_MINIMAL_ACCENT_TEMPLATE = string.Template(
+    """
+QLabel {
+    border-radius: 3px;
+    background-color: $start;
+}
+"""
+)
+_TOAST_TITLE_TEMPLATE = string.Template(
+    """
+QLabel {
+    font-size: 11px;
+    letter-spacing: 1px;
+    text-transform: uppercase;
+    color: $color;
+    background-color: transparent;
+}
+"""
+)
+_TOAST_TEXT_TEMPLATE = string.Template(
+    """
+QLabel {
+    color: $color;
+    font-size: 15px;
+    font-weight: 500;
+    background-color: transparent;
+}
+"""
+)
+_TOAST_HINT_TEMPLATE = string.Template(
+    """
+QLabel {
+    color: $color;
+    font-size: 11px;
+    background-color: transparent;
+}
+"""
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _toast_stylesheets(
+    start_hex: str,
+    end_hex: str,
+    dark_mode: bool,
+    overlay_theme: str,
+    overlay_opacity: int,
+) -> Tuple[str, str, str, str, str, str]:
+    """Sheets for the toast container, card, accent dot, title, text and hint."""
+    start = QtGui.QColor(start_hex)
+    base_bg = QtGui.QColor("#181a28") if dark_mode else QtGui.QColor("#ffffff")
+    opacity = clamp(overlay_opacity / 100.0, 0.2, 1.0)
+
+    if overlay_theme == "glass":
+        surface_bg = QtGui.QColor(35, 38, 54) if dark_mode else QtGui.QColor(255, 255, 255)
+        background_color = color_to_rgba(surface_bg, max(0.45, opacity * 0.7))
+        border_color = color_to_rgba(QtGui.QColor(255, 255, 255), 0.26 if dark_mode else 0.22)
+        halo_color = color_to_rgba(QtGui.QColor(18, 20, 32), 0.55 if dark_mode else 0.35)
+        container_style = f"QFrame {{ background-color: {halo_color}; border-radius: 20px; }}"
+    elif overlay_theme == "minimal":
+        background_color = color_to_rgba(base_bg, max(0.5, opacity))
+        border_color = color_to_rgba(start, 0.2)
+        container_style = "QFrame { background-color: transparent; border-radius: 20px; }"
+    else:
+        background_color = color_to_rgba(base_bg, opacity)
+        border_color = color_to_rgba(start, 0.45)
+        halo_color = color_to_rgba(QtGui.QColor(11, 12, 20), 0.6 if dark_mode else 0.18)
+        container_style = f"QFrame {{ background-color: {halo_color}; border-radius: 20px; }}"
+
+    accent_template = _TOAST_MINIMAL_ACCENT_TEMPLATE if overlay_theme == "minimal" else _TOAST_ACCENT_TEMPLATE
+
+    text_color = "#f5f7ff" if dark_mode else "#222330"
+    hint_color = "rgba(154, 163, 192, 200)" if dark_mode else "rgba(72, 80, 98, 200)"
+    title_color = "rgba(245, 247, 255, 180)" if dark_mode else "rgba(44, 48, 68, 200)"
+    if overlay_theme == "glass" and not dark_mode:
+        text_color = "#1f2338"
+        hint_color = "rgba(62, 70, 96, 200)"
+        title_color = "rgba(28, 30, 48, 220)"
+
+    return (
+        container_style,
+        _TOAST_CARD_TEMPLATE.substitute(background=background_color, border=border_color),
+        accent_template.substitute(start=start_hex, end=end_hex),
+        _TOAST_TITLE_TEMPLATE.substitute(color=title_color),
+        _TOAST_TEXT_TEMPLATE.substitute(color=text_color),
+        _TOAST_HINT_TEMPLATE.substitute(color=hint_color),
+    )
 
 
 class PreviewToast(QtWidgets.QWidget):
@@ -740,11 +1340,10 @@ class PreviewToast(QtWidgets.QWidget):
         self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._start_fade_out)
 
-        self._opacity_effect = QtWidgets.QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
-        self._opacity_effect.setOpacity(0.0)
+        # Fade the top-level window itself; the compositor blends it, no offscreen pass.
+        self.setWindowOpacity(0.0)
 
-        self._fade = QtCore.QPropertyAnimation(self._opacity_effect, b"opacity", self)
+        self._fade = QtCore.QPropertyAnimation(self, b"windowOpacity", self)
         self._fade.setDuration(160)
         self._fade.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
         self._fade.finished.connect(self._on_fade_finished)
@@ -760,6 +1359,8 @@ class PreviewToast(QtWidgets.QWidget):
         self._current_geom: Optional[QtCore.QRect] = None
         self._active_item: Optional[ClipboardItem] = None
         self._pixmap_cache: Dict[str, QtGui.QPixmap] = {}
+        # style sheets last applied to the card widgets, see _toast_stylesheets
+        self._sheets: Tuple[str, ...] = ()
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -767,7 +1368,6 @@ class PreviewToast(QtWidgets.QWidget):
 
         self._card_container = QtWidgets.QFrame()
         self._card_container.setObjectName("toastContainer")
-        self._card_container.setStyleSheet("QFrame { background-color: transparent; }")
         container_layout = QtWidgets.QVBoxLayout(self._card_container)
         container_layout.setContentsMargins(8, 8, 8, 8)
         container_layout.setSpacing(0)
@@ -788,17 +1388,6 @@ class PreviewToast(QtWidgets.QWidget):
 
         self._title_label = QtWidgets.QLabel("Clipboard Preview")
         self._title_label.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-        self._title_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 11px;
-                letter-spacing: 1px;
-                text-transform: uppercase;
-                color: rgba(245, 247, 255, 180);
-                background-color: transparent;
-            }
-            """
-        )
         title_row.addWidget(self._title_label)
         title_row.addStretch(1)
         card_layout.addLayout(title_row)
@@ -806,16 +1395,6 @@ class PreviewToast(QtWidgets.QWidget):
         self._label = QtWidgets.QLabel("")
         self._label.setWordWrap(True)
         self._label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-        self._label.setStyleSheet(
-            """
-            QLabel {
-                color: #f5f7ff;
-                font-size: 15px;
-                font-weight: 500;
-                background-color: transparent;
-            }
-            """
-        )
         card_layout.addWidget(self._label)
 
         self._image_label = QtWidgets.QLabel()
@@ -824,15 +1403,6 @@ class PreviewToast(QtWidgets.QWidget):
         card_layout.addWidget(self._image_label)
 
         self._hint = QtWidgets.QLabel("Strg+V fuegt ein | Esc blendet aus")
-        self._hint.setStyleSheet(
-            """
-            QLabel {
-                color: rgba(154, 163, 192, 200);
-                font-size: 11px;
-                background-color: transparent;
-            }
-            """
-        )
         card_layout.addWidget(self._hint)
         card_layout.setAlignment(self._hint, QtCore.Qt.AlignLeft | QtCore.Qt.AlignBottom)
 
@@ -856,109 +1426,25 @@ class PreviewToast(QtWidgets.QWidget):
             super().hide()
             self._current_pos = None
             return
-        start = QtGui.QColor(self._settings.accent_start)
-        if not start.isValid():
-            start = QtGui.QColor("#7f5af0")
-        end = QtGui.QColor(self._settings.accent_end)
-        if not end.isValid():
-            end = QtGui.QColor("#2cb67d")
-        dark_mode = self._settings.theme_mode == "dark"
         overlay_theme = (
             self._settings.overlay_theme
             if getattr(self._settings, "overlay_theme", "classic") in OVERLAY_THEMES
             else "classic"
         )
-        base_bg = QtGui.QColor("#181a28") if dark_mode else QtGui.QColor("#ffffff")
-        opacity = clamp(self._settings.overlay_opacity / 100.0, 0.2, 1.0)
-
-        if overlay_theme == "glass":
-            surface_bg = QtGui.QColor(35, 38, 54) if dark_mode else QtGui.QColor(255, 255, 255)
-            background_color = color_to_rgba(surface_bg, max(0.45, opacity * 0.7))
-            border_rule = f"border: 1px solid {color_to_rgba(QtGui.QColor(255, 255, 255), 0.26 if dark_mode else 0.22)};"
-            halo_color = color_to_rgba(QtGui.QColor(18, 20, 32), 0.55 if dark_mode else 0.35)
-            container_style = f"QFrame {{ background-color: {halo_color}; border-radius: 20px; }}"
-        elif overlay_theme == "minimal":
-            background_color = color_to_rgba(base_bg, max(0.5, opacity))
-            border_rule = f"border: 1px solid {color_to_rgba(start, 0.2)};"
-            container_style = "QFrame { background-color: transparent; border-radius: 20px; }"
-        else:
-            background_color = color_to_rgba(base_bg, opacity)
-            border_rule = f"border: 1px solid {color_to_rgba(start, 0.45)};"
-            halo_color = color_to_rgba(QtGui.QColor(11, 12, 20), 0.6 if dark_mode else 0.18)
-            container_style = f"QFrame {{ background-color: {halo_color}; border-radius: 20px; }}"
-
-        if isinstance(getattr(self, "_card_container", None), QtWidgets.QFrame):
-            self._card_container.setStyleSheet(container_style)
-        self._card.setStyleSheet(
-            f"""
-            QFrame#toastCard {{
-                background-color: {background_color};
-                border-radius: 16px;
-                {border_rule}
-            }}
-            """
-        )
-        if overlay_theme == "minimal":
-            accent_style = (
-                f"""
-                QLabel {{
-                    border-radius: 3px;
-                    background-color: {start.name()};
-                }}
-                """
-            )
-        else:
-            accent_style = (
-                f"""
-                QLabel {{
-                    border-radius: 5px;
-                    background-color: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {start.name()}, stop:1 {end.name()}
-                    );
-                }}
-                """
-            )
-        self._accent_icon.setStyleSheet(accent_style)
-
-        text_color = "#f5f7ff" if dark_mode else "#222330"
-        hint_color = "rgba(154, 163, 192, 200)" if dark_mode else "rgba(72, 80, 98, 200)"
-        title_color = "rgba(245, 247, 255, 180)" if dark_mode else "rgba(44, 48, 68, 200)"
-        if overlay_theme == "glass" and not dark_mode:
-            text_color = "#1f2338"
-            hint_color = "rgba(62, 70, 96, 200)"
-            title_color = "rgba(28, 30, 48, 220)"
-
-        self._title_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 11px;
-                letter-spacing: 1px;
-                text-transform: uppercase;
-                color: {title_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        self._label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {text_color};
-                font-size: 15px;
-                font-weight: 500;
-                background-color: transparent;
-            }}
-            """
-        )
-        self._hint.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {hint_color};
-                font-size: 11px;
-                background-color: transparent;
-            }}
-            """
+        sheets = _toast_stylesheets(
+            _normalize_color(self._settings.accent_start, "#7f5af0"),
+            _normalize_color(self._settings.accent_end, "#2cb67d"),
+            self._settings.theme_mode == "dark",
+            overlay_theme,
+            self._settings.overlay_opacity,
         )
+        # Qt reparses a sheet on every setStyleSheet, even an identical one.
+        if sheets == self._sheets:
+            return
+        self._sheets = sheets
+        widgets = (self._card_container, self._card, self._accent_icon, self._title_label, self._label, self._hint)
+        for widget, sheet in zip(widgets, sheets):
+            widget.setStyleSheet(sheet)
 
     def _start_fade_out(self) -> None:
         self._timer.stop()
@@ -1019,7 +1505,7 @@ class PreviewToast(QtWidgets.QWidget):
             start_pos = QtCore.QPoint(target_pos)
         if not self.isVisible():
             self.move(start_pos)
-            self._opacity_effect.setOpacity(0.0)
+            self.setWindowOpacity(0.0)
             super().show()
             self.raise_()
             self._start_show_animation(target_pos, duration=self._settings.animation_in_ms, start_pos=start_pos)
@@ -1064,7 +1550,7 @@ class PreviewToast(QtWidgets.QWidget):
     def _animate_opacity(self, value: float, hide_after: bool, duration: Optional[int] = None) -> None:
         self._fade.stop()
         self._fade_target = value
-        self._fade.setStartValue(self._opacity_effect.opacity())
+        self._fade.setStartValue(self.windowOpacity())
         self._fade.setEndValue(value)
         if duration is None:
             duration = self._settings.animation_out_ms if hide_after else self._settings.animation_in_ms
@@ -1139,9 +1625,11 @@ class PreviewToast(QtWidgets.QWidget):
         else:
             snippet = item.content
         snippet = snippet.replace("\r", " ").replace("\n", " ")
-        snippet = re.sub(r'(\S{60})', r'\1' + '\u200b', snippet)
         if len(snippet) > 340:
             snippet = snippet[:340] + "..."
+        if len(snippet) > 60:
+            # QLabel only breaks at whitespace, so give long runs a break opportunity
+            snippet = _WRAP_RE.sub(r"\1" + _ZWS, snippet)
         return snippet or "<leer>"
 
     def _get_pixmap(self, data: str) -> Optional[QtGui.QPixmap]:
@@ -1165,10 +1653,58 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         super().__init__(parent)
         self._settings = settings
         self._pixmap_cache: Dict[str, QtGui.QPixmap] = {}
+        self._parse_accents()
+        self._font_key: Optional[str] = None
+        self._ts_font: Optional[QtGui.QFont] = None
+        self._ts_metrics: Optional[QtGui.QFontMetrics] = None
+        self._format_font: Optional[QtGui.QFont] = None
+        self._format_metrics: Optional[QtGui.QFontMetrics] = None
+        self._content_font: Optional[QtGui.QFont] = None
+        self._icon_font = QtGui.QFont("Segoe UI", 9, QtGui.QFont.Bold)
+        # uid -> (text width, row size); measuring wraps the preview in a QTextDocument
+        self._size_cache: Dict[int, Tuple[int, QtCore.QSize]] = {}
+        # uid -> (text width, laid-out preview); paint reuses the glyph layout
+        self._text_cache: Dict[int, Tuple[int, QtGui.QStaticText]] = {}
+        self._text_option = QtGui.QTextOption()
+        self._text_option.setWrapMode(QtGui.QTextOption.WrapAtWordBoundaryOrAnywhere)
+        self._text_option.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
 
     def update_settings(self, settings: AppSettings) -> None:
         self._settings = settings
         self._pixmap_cache.clear()
+        self._parse_accents()
+        self._font_key = None
+
+    def invalidate(self, entry: Optional[ClipboardItem] = None) -> None:
+        """Forget cached measurements for one entry, or for all entries."""
+        if entry is None:
+            self._size_cache.clear()
+            self._text_cache.clear()
+        else:
+            self._size_cache.pop(entry.uid, None)
+            self._text_cache.pop(entry.uid, None)
+
+    def _ensure_fonts(self, base_font: QtGui.QFont) -> None:
+        key = base_font.key()
+        if key == self._font_key:
+            return
+        small_size = max(base_font.pointSize() - 1, 8)
+        self._ts_font = QtGui.QFont(base_font)
+        self._ts_font.setPointSize(small_size)
+        self._ts_metrics = QtGui.QFontMetrics(self._ts_font)
+        self._format_font = QtGui.QFont(base_font)
+        self._format_font.setPointSize(small_size)
+        self._format_font.setBold(True)
+        self._format_metrics = QtGui.QFontMetrics(self._format_font)
+        self._content_font = QtGui.QFont(base_font)
+        self._content_font.setPointSize(base_font.pointSize() + 1)
+        self._font_key = key
+        self._size_cache.clear()
+        self._text_cache.clear()
+
+    def _parse_accents(self) -> None:
+        self._start_color = self._settings.accent_start_qcolor()
+        self._end_color = self._settings.accent_end_qcolor()
 
     def paint(
         self,
@@ -1188,12 +1724,8 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         is_selected = option.state & QtWidgets.QStyle.State_Selected
         dark_mode = self._settings.theme_mode == "dark"
 
-        accent_color = QtGui.QColor(self._settings.accent_start)
-        if not accent_color.isValid():
-            accent_color = QtGui.QColor("#7f5af0")
-        alt_accent = QtGui.QColor(self._settings.accent_end)
-        if not alt_accent.isValid():
-            alt_accent = QtGui.QColor("#2cb67d")
+        accent_color = self._start_color
+        alt_accent = self._end_color
 
         base_color = QtGui.QColor(34, 38, 54) if dark_mode else QtGui.QColor(248, 249, 254)
         border_color = QtGui.QColor(58, 63, 85) if dark_mode else QtGui.QColor(215, 220, 235)
@@ -1236,12 +1768,11 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         star_rect = self._star_rect(card_rect)
         delete_rect = self._delete_rect(card_rect)
 
-        timestamp = time.strftime("%d.%m.%Y %H:%M", time.localtime(entry.timestamp))
-        timestamp_font = QtGui.QFont(option.font)
-        timestamp_font.setPointSize(max(option.font.pointSize() - 1, 8))
-        painter.setFont(timestamp_font)
+        self._ensure_fonts(option.font)
+        timestamp = entry.timestamp_str
+        painter.setFont(self._ts_font)
         painter.setPen(muted_color)
-        timestamp_metrics = QtGui.QFontMetrics(timestamp_font)
+        timestamp_metrics = self._ts_metrics
         timestamp_height = timestamp_metrics.height()
         timestamp_rect = QtCore.QRect(
             card_rect.left() + 24,
@@ -1256,11 +1787,8 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         )
 
         format_label = self._format_label(entry)
-        format_font = QtGui.QFont(option.font)
-        format_font.setPointSize(max(option.font.pointSize() - 1, 8))
-        format_font.setBold(True)
-        painter.setFont(format_font)
-        metrics = QtGui.QFontMetrics(format_font)
+        painter.setFont(self._format_font)
+        metrics = self._format_metrics
         pill_width = metrics.horizontalAdvance(format_label) + 24
         pill_width = min(pill_width, max(card_rect.width() - 48, 60))
         pill_height = 26
@@ -1301,17 +1829,11 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
             )
             thumb_rect = None
 
-        body_font = QtGui.QFont(option.font)
-        body_font.setPointSize(option.font.pointSize() + 1)
-        snippet_text = self._preview_text(entry)
-        text_option = QtGui.QTextOption()
-        text_option.setWrapMode(QtGui.QTextOption.WordWrap)
-        text_option.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
         painter.save()
         painter.setClipRect(content_rect)
         painter.setPen(text_color)
-        painter.setFont(body_font)
-        painter.drawText(QtCore.QRectF(content_rect), snippet_text, text_option)
+        painter.setFont(self._content_font)
+        painter.drawStaticText(content_rect.topLeft(), self._static_text(entry, available_width))
         painter.restore()
 
         self._draw_format_icon(painter, icon_rect, entry, text_color)
@@ -1367,15 +1889,19 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         else:
             available_width = max(card_width - 88, 160)
 
-        body_font = QtGui.QFont(option.font)
-        body_font.setPointSize(option.font.pointSize() + 1)
+        self._ensure_fonts(option.font)
+        cached = self._size_cache.get(entry.uid)
+        if cached is not None and cached[0] == available_width:
+            return cached[1]
         snippet_text = self._preview_text(entry)
-        text_height = self._text_height(snippet_text, body_font, available_width)
+        text_height = self._text_height(snippet_text, self._content_font, available_width)
 
         min_content_height = 68 if has_image else 24
         content_height = max(int(math.ceil(text_height)), min_content_height)
         total_height = content_height + 84
-        return QtCore.QSize(0, total_height)
+        size = QtCore.QSize(0, total_height)
+        self._size_cache[entry.uid] = (available_width, size)
+        return size
 
     def editorEvent(
         self,
@@ -1453,16 +1979,14 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
     def _draw_format_icon(self, painter: QtGui.QPainter, rect: QtCore.QRect, entry: ClipboardItem, text_color: QtGui.QColor) -> None:
         painter.save()
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        base_color = QtGui.QColor(self._settings.accent_start)
-        if not base_color.isValid():
-            base_color = QtGui.QColor("#7f5af0")
+        base_color = self._start_color
         highlight = QtGui.QColor(text_color)
         highlight.setAlpha(90 if self._settings.theme_mode == "dark" else 120)
         painter.setBrush(base_color)
         painter.setPen(QtGui.QPen(highlight, 1.2))
         painter.drawEllipse(rect)
         painter.setPen(QtGui.QPen(QtGui.QColor("#ffffff")))
-        painter.setFont(QtGui.QFont("Segoe UI", 9, QtGui.QFont.Bold))
+        painter.setFont(self._icon_font)
         icons = {
             "image": "IMG",
             "html": "HTM",
@@ -1475,11 +1999,26 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         painter.drawText(rect, QtCore.Qt.AlignCenter, icons.get(entry.format, "TXT"))
         painter.restore()
 
+    def _static_text(self, entry: ClipboardItem, width: int) -> QtGui.QStaticText:
+        cached = self._text_cache.get(entry.uid)
+        if cached is not None and cached[0] == width:
+            return cached[1]
+        static = QtGui.QStaticText(self._preview_text(entry))
+        static.setTextFormat(QtCore.Qt.PlainText)
+        static.setTextOption(self._text_option)
+        static.setTextWidth(width)
+        static.prepare(QtGui.QTransform(), self._content_font)
+        self._text_cache[entry.uid] = (width, static)
+        return static
+
     def _text_height(self, text: str, font: QtGui.QFont, width: int) -> float:
         if width <= 0:
             width = 160
         doc = QtGui.QTextDocument()
         doc.setDefaultFont(font)
+        text_option = doc.defaultTextOption()
+        text_option.setWrapMode(QtGui.QTextOption.WrapAtWordBoundaryOrAnywhere)
+        doc.setDefaultTextOption(text_option)
         doc.setPlainText(text or "")
         doc.setTextWidth(float(width))
         height = doc.size().height()
@@ -1516,7 +2055,6 @@ class HistoryDelegate(QtWidgets.QStyledItemDelegate):
         else:
             snippet = entry.content
         snippet = snippet.replace("\r", " ").replace("\n", " ")
-        snippet = re.sub(r"(\S{60})", r"\1" + "\u200b", snippet)
         if len(snippet) > 340:
             snippet = snippet[:340] + "..."
         return snippet or "<leer>"
@@ -1736,6 +2274,147 @@ class SmoothListWidget(QtWidgets.QListWidget):
         self._anim.setEndValue(end)
         self._anim.start()
         event.accept()
+
+
+@functools.lru_cache(maxsize=4)
+def _shadow_tile(alpha: int, radius: int, blur: int) -> QtGui.QPixmap:
+    """Blurred rounded-rect shadow, drawn once and stretched as a 9-slice."""
+    inner = 2 * (radius + blur) + 2
+    size = inner + 2 * blur
+    source = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    source.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(source)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(QtGui.QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(QtCore.QRectF(blur, blur, inner, inner), radius, radius)
+    painter.end()
+
+    scene = QtWidgets.QGraphicsScene()
+    item = QtWidgets.QGraphicsPixmapItem(QtGui.QPixmap.fromImage(source))
+    effect = QtWidgets.QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    effect.setBlurHints(QtWidgets.QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    blurred = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    blurred.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(blurred)
+    scene.render(painter, QtCore.QRectF(0, 0, size, size), QtCore.QRectF(0, 0, size, size))
+    painter.end()
+    return QtGui.QPixmap.fromImage(blurred)
+
+
+class _DropShadowHost(QtWidgets.QWidget):
+    """Container that paints a cached soft shadow behind one child widget.
+
+    Replaces QGraphicsDropShadowEffect, which re-renders and blurs the child on every paint.
+    """
+
+    RADIUS = 18
+    BLUR = 40
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self._target: Optional[QtWidgets.QWidget] = None
+        self._offset = QtCore.QPoint(0, 0)
+        self._alpha = 160
+
+    def set_shadow(self, target: QtWidgets.QWidget, offset: QtCore.QPoint, alpha: int) -> None:
+        self._target = target
+        self._offset = offset
+        self._alpha = alpha
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        option = QtWidgets.QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QtWidgets.QStyle.PE_Widget, option, painter, self)
+        target = self._target
+        if target is None or not target.isVisible():
+            return
+        tile = _shadow_tile(self._alpha, self.RADIUS, self.BLUR)
+        # corner slices cover the blur margin plus the rounded corner and its blur
+        edge = 2 * self.BLUR + self.RADIUS
+        center = tile.width() - 2 * edge
+        rect = target.geometry().translated(self._offset).adjusted(-self.BLUR, -self.BLUR, self.BLUR, self.BLUR)
+        if rect.width() < 2 * edge or rect.height() < 2 * edge:
+            return
+        xs = (rect.left(), rect.left() + edge, rect.right() + 1 - edge)
+        ys = (rect.top(), rect.top() + edge, rect.bottom() + 1 - edge)
+        widths = (edge, rect.width() - 2 * edge, edge)
+        heights = (edge, rect.height() - 2 * edge, edge)
+        source_pos = (0, edge, edge + center)
+        source_len = (edge, center, edge)
+        for row in range(3):
+            for col in range(3):
+                painter.drawPixmap(
+                    QtCore.QRect(xs[col], ys[row], widths[col], heights[row]),
+                    tile,
+                    QtCore.QRect(source_pos[col], source_pos[row], source_len[col], source_len[row]),
+                )
+
+
+@functools.lru_cache(maxsize=4)
+def _gradient_frame_pixmap(
+    width: int,
+    height: int,
+    dpr: float,
+    start_rgba: int,
+    end_rgba: int,
+    radius: int,
+) -> QtGui.QPixmap:
+    """Rounded rect with a diagonal two-stop gradient, rendered at device resolution."""
+    pixmap = QtGui.QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QtCore.Qt.transparent)
+    # bounding-box coordinates, like qlineargradient(x1:0, y1:0, x2:1, y2:1)
+    gradient = QtGui.QLinearGradient(0, 0, 1, 1)
+    gradient.setCoordinateMode(QtGui.QGradient.ObjectBoundingMode)
+    gradient.setColorAt(0.0, QtGui.QColor.fromRgba(start_rgba))
+    gradient.setColorAt(1.0, QtGui.QColor.fromRgba(end_rgba))
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(gradient)
+    painter.drawRoundedRect(QtCore.QRectF(0, 0, width, height), radius, radius)
+    painter.end()
+    return pixmap
+
+
+class _GradientFrame(QtWidgets.QFrame):
+    """Frame filled with a cached accent gradient instead of a style sheet qlineargradient."""
+
+    RADIUS = 20
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self._start_rgba = 0
+        self._end_rgba = 0
+
+    def set_colors(self, start: QtGui.QColor, end: QtGui.QColor) -> None:
+        start_rgba, end_rgba = start.rgba(), end.rgba()
+        if (start_rgba, end_rgba) != (self._start_rgba, self._end_rgba):
+            self._start_rgba, self._end_rgba = start_rgba, end_rgba
+            self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(
+            0,
+            0,
+            _gradient_frame_pixmap(
+                self.width(),
+                self.height(),
+                self.devicePixelRatioF(),
+                self._start_rgba,
+                self._end_rgba,
+                self.RADIUS,
+            ),
+        )
+
+
 class HistoryWindow(QtWidgets.QMainWindow):
     itemActivated = QtCore.Signal(ClipboardItem)
 
@@ -1757,38 +2436,18 @@ class HistoryWindow(QtWidgets.QMainWindow):
             | QtCore.Qt.WindowCloseButtonHint
             | QtCore.Qt.WindowMinimizeButtonHint
         )
-        central = QtWidgets.QWidget()
+        central = _DropShadowHost()
+        self._shadow_host = central
         self.setCentralWidget(central)
 
         layout = QtWidgets.QVBoxLayout(central)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(18)
 
-        self._header = QtWidgets.QFrame()
+        self._header = _GradientFrame()
         self._header.setObjectName("historyHeader")
-        self._header.setStyleSheet(
-            """
-            QFrame#historyHeader {
-                border-radius: 20px;
-                padding: 1px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(127, 90, 240, 180),
-                    stop:1 rgba(44, 182, 125, 160)
-                );
-            }
-            """
-        )
         self._header_inner = QtWidgets.QFrame()
         self._header_inner.setObjectName("historyHeaderInner")
-        self._header_inner.setStyleSheet(
-            """
-            QFrame#historyHeaderInner {
-                background-color: rgba(18, 19, 28, 220);
-                border-radius: 18px;
-            }
-            """
-        )
 
         header_layout_outer = QtWidgets.QVBoxLayout(self._header)
         header_layout_outer.setContentsMargins(0, 0, 0, 0)
@@ -1799,30 +2458,13 @@ class HistoryWindow(QtWidgets.QMainWindow):
         header_layout.setSpacing(4)
 
         self._title_label = QtWidgets.QLabel(f"{APP_DISPLAY_NAME} Verlauf")
+        self._title_label.setObjectName("historyTitle")
         self._title_label.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-        self._title_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 22px;
-                font-weight: 700;
-                letter-spacing: 0.5px;
-                background-color: transparent;
-            }
-            """
-        )
         header_layout.addWidget(self._title_label)
 
         self._stats_label = QtWidgets.QLabel("")
+        self._stats_label.setObjectName("historyStats")
         self._stats_label.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-        self._stats_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 12px;
-                color: rgba(245, 247, 255, 160);
-                background-color: transparent;
-            }
-            """
-        )
         header_layout.addWidget(self._stats_label)
         layout.addWidget(self._header)
 
@@ -1846,15 +2488,6 @@ class HistoryWindow(QtWidgets.QMainWindow):
 
         self._list_container = QtWidgets.QFrame()
         self._list_container.setObjectName("historyListContainer")
-        self._list_container.setStyleSheet(
-            """
-            QFrame#historyListContainer {
-                background-color: rgba(18, 19, 28, 210);
-                border-radius: 18px;
-                border: 1px solid rgba(255, 255, 255, 25);
-            }
-            """
-        )
         list_layout = QtWidgets.QVBoxLayout(self._list_container)
         list_layout.setContentsMargins(4, 12, 4, 12)
         list_layout.setSpacing(0)
@@ -1874,16 +2507,8 @@ class HistoryWindow(QtWidgets.QMainWindow):
         self._empty_state = QtWidgets.QLabel(
             "Noch keine Eintraege. Kopiere Text, um hier etwas zu sehen."
         )
+        self._empty_state.setObjectName("historyEmptyState")
         self._empty_state.setAlignment(QtCore.Qt.AlignCenter)
-        self._empty_state.setStyleSheet(
-            """
-            QLabel {
-                color: rgba(154, 163, 192, 180);
-                font-size: 13px;
-                padding: 40px 0;
-            }
-            """
-        )
         list_layout.addWidget(self._empty_state)
         layout.addWidget(self._list_container, 1)
 
@@ -1892,8 +2517,6 @@ class HistoryWindow(QtWidgets.QMainWindow):
 
         self._copy_button = QtWidgets.QPushButton("In Zwischenablage")
         self._copy_button.setProperty("accent", True)
-        self._copy_button.style().unpolish(self._copy_button)
-        self._copy_button.style().polish(self._copy_button)
         actions.addWidget(self._copy_button)
 
         self._qr_button = QtWidgets.QPushButton("QR-Code")
@@ -1903,8 +2526,6 @@ class HistoryWindow(QtWidgets.QMainWindow):
 
         self._settings_button = QtWidgets.QPushButton("Einstellungen")
         self._settings_button.setProperty("accent", True)
-        self._settings_button.style().unpolish(self._settings_button)
-        self._settings_button.style().polish(self._settings_button)
         actions.addWidget(self._settings_button)
 
         self._close_button = QtWidgets.QPushButton("Schliessen")
@@ -1912,12 +2533,6 @@ class HistoryWindow(QtWidgets.QMainWindow):
 
         layout.addLayout(actions)
 
-        shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(40)
-        shadow.setOffset(0, 18)
-        shadow.setColor(QtGui.QColor(0, 0, 0, 160))
-        self._list_container.setGraphicsEffect(shadow)
-
         self._copy_button.clicked.connect(self._activate_selected)
         self._qr_button.clicked.connect(self._show_qr_for_selected)
         self._close_button.clicked.connect(self.close)
@@ -1928,100 +2543,51 @@ class HistoryWindow(QtWidgets.QMainWindow):
         self._list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self._list.customContextMenuRequested.connect(self._show_context_menu)
 
-        history.historyUpdated.connect(self._refresh)
-        self._items_cache: List[ClipboardItem] = history.all_items()
+        history.historyUpdated.connect(self._schedule_refresh, QtCore.Qt.DirectConnection)
+        history.historyItemAdded.connect(self._on_item_added, QtCore.Qt.DirectConnection)
+        history.historyItemRemoved.connect(self._on_item_removed, QtCore.Qt.DirectConnection)
+        # Typing is coalesced: the filter runs once the query has been stable for 80 ms.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(self._on_filter_timeout)
+        # Bulk updates are coalesced to at most one rebuild per frame (~16 ms).
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._on_refresh_timeout)
+        # query the list currently reflects
+        self._last_query = ""
+        # Search columns parallel to _items_cache, so the filter scans two flat sequences
+        # instead of going through item attributes. Built on the first non-empty query.
+        self._search_texts: Optional[List[str]] = None
+        self._search_masks: Optional[array.array] = None
+        # header text for the unfiltered list; dropped whenever items or hotkeys change
+        self._stats_no_query: Optional[str] = None
+        self._items_cache: List[ClipboardItem] = list(history.all_items())
         self._refresh(self._items_cache)
         self._apply_styles()
 
         self._qr_dialog: Optional[QrCodeDialog] = None
 
     def _apply_styles(self) -> None:
-        start = QtGui.QColor(self._settings.accent_start)
-        if not start.isValid():
-            start = QtGui.QColor("#7f5af0")
-        end = QtGui.QColor(self._settings.accent_end)
-        if not end.isValid():
-            end = QtGui.QColor("#2cb67d")
+        # Window chrome is styled by the application sheet (see apply_app_theme);
+        # only the delegate and the list shadow paint with settings of their own.
+        # The shadow is tinted by the container's coverage, like a drop-shadow effect would be.
+        container_alpha = 210 if self._settings.theme_mode == "dark" else 235
+        self._shadow_host.set_shadow(self._list_container, QtCore.QPoint(0, 18), 160 * container_alpha // 255)
         dark_mode = self._settings.theme_mode == "dark"
-        header_start = color_to_rgba(start, 0.75 if dark_mode else 0.45)
-        header_end = color_to_rgba(end, 0.65 if dark_mode else 0.35)
-        self._header.setStyleSheet(
-            f"""
-            QFrame#historyHeader {{
-                border-radius: 20px;
-                padding: 1px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {header_start},
-                    stop:1 {header_end}
-                );
-            }}
-            """
-        )
-        inner_bg = "rgba(18, 19, 28, 220)" if dark_mode else "rgba(247, 248, 255, 235)"
-        self._header_inner.setStyleSheet(
-            f"""
-            QFrame#historyHeaderInner {{
-                background-color: {inner_bg};
-                border-radius: 18px;
-            }}
-            """
-        )
-        list_bg = "rgba(18, 19, 28, 210)" if dark_mode else "rgba(255, 255, 255, 235)"
-        list_border = color_to_rgba(start, 0.25 if dark_mode else 0.3)
-        self._list_container.setStyleSheet(
-            f"""
-            QFrame#historyListContainer {{
-                background-color: {list_bg};
-                border-radius: 18px;
-                border: 1px solid {list_border};
-            }}
-            """
-        )
-        title_color = "#f5f7ff" if dark_mode else "#1f2338"
-        stats_color = (
-            "rgba(245, 247, 255, 160)" if dark_mode else "rgba(70, 75, 95, 200)"
-        )
-        empty_color = (
-            "rgba(154, 163, 192, 180)" if dark_mode else "rgba(110, 118, 140, 200)"
-        )
-        self._title_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 22px;
-                font-weight: 700;
-                letter-spacing: 0.5px;
-                color: {title_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        self._stats_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 12px;
-                color: {stats_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        self._empty_state.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {empty_color};
-                font-size: 13px;
-                padding: 40px 0;
-            }}
-            """
-        )
-        for button in (self._copy_button, self._settings_button):
-            button.style().unpolish(button)
-            button.style().polish(button)
+        header_start = QtGui.QColor(self._settings.accent_start_qcolor())
+        header_end = QtGui.QColor(self._settings.accent_end_qcolor())
+        header_start.setAlpha(int((0.75 if dark_mode else 0.45) * 255))
+        header_end.setAlpha(int((0.65 if dark_mode else 0.35) * 255))
+        self._header.set_colors(header_start, header_end)
         self._delegate.update_settings(self._settings)
         self._list.viewport().update()
 
     def apply_settings(self, settings: AppSettings) -> None:
         self._settings = settings
+        self._stats_no_query = None
         self._apply_styles()
         self._apply_current_filter()
 
@@ -2030,74 +2596,150 @@ class HistoryWindow(QtWidgets.QMainWindow):
             self._settings_callback()
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if obj is self._list and event.type() == QtCore.QEvent.KeyPress:
-            if event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
-                self._activate_selected()
-                return True
-            if event.key() == QtCore.Qt.Key_Delete:
-                self._delete_selected()
+        # sees every event of the list (paint, hover, mouse moves); keys are the rare case
+        if event.type() == QtCore.QEvent.KeyPress and obj is self._list:
+            handler = self._LIST_KEY_HANDLERS.get(event.key())
+            if handler is not None:
+                handler(self)
                 return True
         return super().eventFilter(obj, event)
 
     def _refresh(self, items: List[ClipboardItem]) -> None:
-        self._items_cache = items
+        self._items_cache = list(items)
+        self._search_texts = None
+        self._search_masks = None
+        self._stats_no_query = None
+        # kept rows may have been edited in place; re-measure them
+        self._delegate.invalidate()
         self._apply_current_filter()
+        self._list.doItemsLayout()
+
+    def _schedule_refresh(self, _items: Sequence[ClipboardItem]) -> None:
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _on_refresh_timeout(self) -> None:
+        # read the history now: single adds/removes may have followed the last bulk update
+        self._refresh(self._history.all_items())
+
+    def _on_item_added(self, entry: ClipboardItem, row: int) -> None:
+        if self._refresh_timer.isActive():
+            return  # the pending rebuild picks this up
+        self._items_cache.insert(row, entry)
+        self._stats_no_query = None
+        if self._search_texts is not None:
+            self._search_texts.insert(row, entry.search_text)
+            self._search_masks.insert(row, entry.search_mask)
+        if self._last_query:
+            self._apply_current_filter()
+            return
+        self._list.insertItem(row, self._make_list_item(entry))
+        self._empty_state.setVisible(False)
+        self._list.setVisible(True)
+        self._list.setCurrentRow(0)
+        self._update_stats(self._list.count())
+
+    def _on_item_removed(self, row: int) -> None:
+        if self._refresh_timer.isActive():
+            return  # the pending rebuild picks this up
+        if not 0 <= row < len(self._items_cache):
+            return
+        self._delegate.invalidate(self._items_cache.pop(row))
+        self._stats_no_query = None
+        if self._search_texts is not None:
+            del self._search_texts[row]
+            del self._search_masks[row]
+        if self._last_query:
+            self._apply_current_filter()
+            return
+        self._list.takeItem(row)
+        has_items = bool(self._items_cache)
+        self._empty_state.setVisible(not has_items)
+        self._list.setVisible(has_items)
+        self._update_stats(self._list.count())
 
     def _on_search_changed(self, _: str) -> None:
-        self._apply_current_filter()
+        self._filter_timer.start()
+
+    def _on_filter_timeout(self) -> None:
+        if self._search_box.text().strip().lower() != self._last_query:
+            self._apply_current_filter()
 
     def _apply_current_filter(self) -> None:
+        self._filter_timer.stop()
         query = self._search_box.text().strip().lower()
+        self._last_query = query
         if query:
-            visible = [item for item in self._items_cache if self._matches_query(item, query)]
+            if self._search_texts is None:
+                self._search_texts = [item.search_text for item in self._items_cache]
+                self._search_masks = array.array("Q", (item.search_mask for item in self._items_cache))
+            query_mask = char_mask(query)
+            items = self._items_cache
+            matches_pinned = query in "pinned"
+            visible = [
+                items[index]
+                for index, (mask, text) in enumerate(zip(self._search_masks, self._search_texts))
+                # the mask test drops items lacking one of the query's characters
+                if (not query_mask & ~mask and query in text) or (matches_pinned and items[index].pinned)
+            ]
         else:
             visible = list(self._items_cache)
         self._populate_list(visible)
         self._update_stats(len(visible))
 
     def _populate_list(self, items: List[ClipboardItem]) -> None:
-        self._list.clear()
-        for entry in items:
-            item = QtWidgets.QListWidgetItem()
-            item.setData(QtCore.Qt.UserRole, entry)
-            height = 152 if entry.format == "image" else 108
-            item.setSizeHint(QtCore.QSize(0, height))
-            self._list.addItem(item)
+        # Diff against the rows already shown instead of clear() + re-adding every item:
+        # a keystroke in the search box usually only hides or reveals a few rows.
+        self._list.setUpdatesEnabled(False)
+        try:
+            wanted = {entry.uid for entry in items}
+            kept: Dict[int, QtWidgets.QListWidgetItem] = {}
+            for row in range(self._list.count() - 1, -1, -1):
+                list_item = self._list.item(row)
+                uid = list_item.data(QtCore.Qt.UserRole).uid
+                if uid in wanted:
+                    kept[uid] = list_item
+                else:
+                    self._list.takeItem(row)
+            for row, entry in enumerate(items):
+                current = self._list.item(row)
+                if current is not None and current.data(QtCore.Qt.UserRole) is entry:
+                    continue
+                list_item = kept.get(entry.uid)
+                if list_item is None:
+                    list_item = self._make_list_item(entry)
+                else:
+                    # moved (pin toggled): reuse the existing row object
+                    self._list.takeItem(self._list.row(list_item))
+                self._list.insertItem(row, list_item)
+        finally:
+            self._list.setUpdatesEnabled(True)
         has_items = bool(items)
         self._empty_state.setVisible(not has_items)
         self._list.setVisible(has_items)
         if has_items:
             self._list.setCurrentRow(0)
 
+    @staticmethod
+    def _make_list_item(entry: ClipboardItem) -> QtWidgets.QListWidgetItem:
+        item = QtWidgets.QListWidgetItem()
+        item.setData(QtCore.Qt.UserRole, entry)
+        height = 152 if entry.format == "image" else 108
+        item.setSizeHint(QtCore.QSize(0, height))
+        return item
+
     def _update_stats(self, visible_count: int) -> None:
         total = len(self._items_cache)
-        query = self._search_box.text().strip()
-        pinned = len([item for item in self._items_cache if item.pinned])
-        if query:
+        if self._last_query:
             self._stats_label.setText(f"{visible_count} Treffer | {total} Eintraege gesamt")
-        else:
-            self._stats_label.setText(
+            return
+        if self._stats_no_query is None:
+            pinned = sum(1 for item in self._items_cache if item.pinned)
+            self._stats_no_query = (
                 f"{total} Eintraege (davon {pinned} angepinnt) | "
                 f"{display_hotkey(self._settings.hotkey_prev)} / {display_hotkey(self._settings.hotkey_next)}"
             )
-
-    def _matches_query(self, item: ClipboardItem, query: str) -> bool:
-        candidates: List[str] = []
-        if item.content:
-            candidates.append(item.content.lower())
-        if item.html:
-            doc = QtGui.QTextDocument()
-            doc.setHtml(item.html)
-            candidates.append(doc.toPlainText().lower())
-        for path_value in item.files:
-            candidates.append(Path(path_value).name.lower())
-        for url in item.urls:
-            candidates.append(url.lower())
-        if item.format == "image":
-            candidates.append("bild")
-        if item.pinned:
-            candidates.append("pinned")
-        return any(query in candidate for candidate in candidates if candidate)
+        self._stats_label.setText(self._stats_no_query)
 
     def _activate_selected(self) -> None:
         selected = self._list.currentItem()
@@ -2119,6 +2761,13 @@ class HistoryWindow(QtWidgets.QMainWindow):
             else:
                 self._history.remove_entry(entry)
 
+    # key -> handler for key presses on the list, see eventFilter
+    _LIST_KEY_HANDLERS = {
+        QtCore.Qt.Key_Return: _activate_selected,
+        QtCore.Qt.Key_Enter: _activate_selected,
+        QtCore.Qt.Key_Delete: _delete_selected,
+    }
+
     def _show_context_menu(self, point: QtCore.QPoint) -> None:
         item = self._list.itemAt(point)
         if item is None:
@@ -2266,6 +2915,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self._settings = settings.copy()
         self._accent_start_color = self._settings.accent_start
         self._accent_end_color = self._settings.accent_end
+        self._result_settings: Optional[AppSettings] = None
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -2280,9 +2930,8 @@ class SettingsDialog(QtWidgets.QDialog):
         self._scale_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
         self._scale_slider.setRange(60, 160)
         self._scale_slider.setTickInterval(5)
-        self._scale_slider.setValue(int(self._settings.toast_scale * 100))
         self._scale_slider.setTickPosition(QtWidgets.QSlider.TicksBelow)
-        self._scale_value_label = QtWidgets.QLabel(f"{self._scale_slider.value()} %")
+        self._scale_value_label = QtWidgets.QLabel()
         self._scale_value_label.setMinimumWidth(48)
         scale_row.addWidget(self._scale_slider, 1)
         scale_row.addWidget(self._scale_value_label, 0)
@@ -2294,15 +2943,11 @@ class SettingsDialog(QtWidgets.QDialog):
         self._duration_spin = QtWidgets.QSpinBox()
         self._duration_spin.setRange(600, 10000)
         self._duration_spin.setSingleStep(100)
-        self._duration_spin.setValue(self._settings.toast_duration_ms)
         overlay_layout.addRow("Anzeigezeit (ms):", self._duration_spin)
 
         self._theme_combo = QtWidgets.QComboBox()
         self._theme_combo.addItem("Dunkel", "dark")
         self._theme_combo.addItem("Hell", "light")
-        theme_index = self._theme_combo.findData(self._settings.theme_mode)
-        if theme_index >= 0:
-            self._theme_combo.setCurrentIndex(theme_index)
         overlay_layout.addRow("Theme:", self._theme_combo)
 
         self._overlay_theme_combo = QtWidgets.QComboBox()
@@ -2313,9 +2958,6 @@ class SettingsDialog(QtWidgets.QDialog):
         ]
         for label, value in overlay_theme_options:
             self._overlay_theme_combo.addItem(label, value)
-        overlay_theme_index = self._overlay_theme_combo.findData(self._settings.overlay_theme)
-        if overlay_theme_index >= 0:
-            self._overlay_theme_combo.setCurrentIndex(overlay_theme_index)
         overlay_layout.addRow("Overlay-Style:", self._overlay_theme_combo)
 
         opacity_container = QtWidgets.QWidget()
@@ -2324,15 +2966,13 @@ class SettingsDialog(QtWidgets.QDialog):
         opacity_layout.setSpacing(6)
         self._opacity_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
         self._opacity_slider.setRange(20, 100)
-        self._opacity_slider.setValue(self._settings.overlay_opacity)
-        self._opacity_value_label = QtWidgets.QLabel(f"{self._settings.overlay_opacity}%")
+        self._opacity_value_label = QtWidgets.QLabel()
         self._opacity_slider.valueChanged.connect(lambda v: self._opacity_value_label.setText(f"{v}%"))
         opacity_layout.addWidget(self._opacity_slider, 1)
         opacity_layout.addWidget(self._opacity_value_label)
         overlay_layout.addRow("Overlay Opazitaet:", opacity_container)
 
         self._follow_checkbox = QtWidgets.QCheckBox("Toast folgt dem Mauszeiger")
-        self._follow_checkbox.setChecked(self._settings.overlay_follow_mouse)
         overlay_layout.addRow("Maus-Follow:", self._follow_checkbox)
 
         self._anchor_combo = QtWidgets.QComboBox()
@@ -2340,11 +2980,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self._anchor_combo.addItem("Oben rechts", "top-right")
         self._anchor_combo.addItem("Unten links", "bottom-left")
         self._anchor_combo.addItem("Unten rechts", "bottom-right")
-        anchor_index = self._anchor_combo.findData(self._settings.overlay_anchor)
-        if anchor_index >= 0:
-            self._anchor_combo.setCurrentIndex(anchor_index)
         overlay_layout.addRow("Verankerung:", self._anchor_combo)
-        self._anchor_combo.setEnabled(not self._follow_checkbox.isChecked())
         self._follow_checkbox.toggled.connect(lambda checked: self._anchor_combo.setEnabled(not checked))
 
         offset_container = QtWidgets.QWidget()
@@ -2353,10 +2989,8 @@ class SettingsDialog(QtWidgets.QDialog):
         offset_layout.setSpacing(6)
         self._offset_x_spin = QtWidgets.QSpinBox()
         self._offset_x_spin.setRange(-500, 500)
-        self._offset_x_spin.setValue(self._settings.overlay_offset_x)
         self._offset_y_spin = QtWidgets.QSpinBox()
         self._offset_y_spin.setRange(-500, 500)
-        self._offset_y_spin.setValue(self._settings.overlay_offset_y)
         offset_layout.addWidget(QtWidgets.QLabel("X:"))
         offset_layout.addWidget(self._offset_x_spin)
         offset_layout.addWidget(QtWidgets.QLabel("Y:"))
@@ -2369,10 +3003,8 @@ class SettingsDialog(QtWidgets.QDialog):
         animation_layout.setSpacing(6)
         self._anim_in_spin = QtWidgets.QSpinBox()
         self._anim_in_spin.setRange(50, 2000)
-        self._anim_in_spin.setValue(self._settings.animation_in_ms)
         self._anim_out_spin = QtWidgets.QSpinBox()
         self._anim_out_spin.setRange(50, 2000)
-        self._anim_out_spin.setValue(self._settings.animation_out_ms)
         animation_layout.addWidget(QtWidgets.QLabel("Ein:"))
         animation_layout.addWidget(self._anim_in_spin)
         animation_layout.addWidget(QtWidgets.QLabel("Aus:"))
@@ -2380,8 +3012,8 @@ class SettingsDialog(QtWidgets.QDialog):
         overlay_layout.addRow("Animation (ms):", animation_container)
 
         color_row = QtWidgets.QHBoxLayout()
-        self._accent_start_button = self._create_color_button(self._accent_start_color)
-        self._accent_end_button = self._create_color_button(self._accent_end_color)
+        self._accent_start_button = self._create_color_button()
+        self._accent_end_button = self._create_color_button()
         start_label = QtWidgets.QLabel("Start")
         end_label = QtWidgets.QLabel("Ende")
         start_label.setStyleSheet("color: rgba(245,247,255,180); background: transparent;")
@@ -2394,11 +3026,9 @@ class SettingsDialog(QtWidgets.QDialog):
         overlay_layout.addRow("Farbverlauf:", color_row)
 
         self._preview_checkbox = QtWidgets.QCheckBox("Overlay beim Durchscrollen anzeigen")
-        self._preview_checkbox.setChecked(self._settings.show_preview_overlay)
         overlay_layout.addRow("Vorschau:", self._preview_checkbox)
 
         self._capture_checkbox = QtWidgets.QCheckBox("Fenster vor Bildschirmaufnahmen schuetzen")
-        self._capture_checkbox.setChecked(self._settings.capture_protection_enabled)
         overlay_layout.addRow("Aufnahmeschutz:", self._capture_checkbox)
 
         layout.addWidget(overlay_group)
@@ -2408,17 +3038,14 @@ class SettingsDialog(QtWidgets.QDialog):
         retention_layout.setLabelAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
 
         self._auto_clear_checkbox = QtWidgets.QCheckBox("Verlauf automatisch bereinigen")
-        self._auto_clear_checkbox.setChecked(self._settings.auto_clear_enabled)
         retention_layout.addRow("Auto-Clear:", self._auto_clear_checkbox)
 
         self._auto_clear_spin = QtWidgets.QSpinBox()
         self._auto_clear_spin.setRange(5, 10080)
         self._auto_clear_spin.setSuffix(" Min")
-        self._auto_clear_spin.setValue(self._settings.auto_clear_interval_minutes)
         retention_layout.addRow("Intervall:", self._auto_clear_spin)
 
         self._auto_clear_checkbox.toggled.connect(self._auto_clear_spin.setEnabled)
-        self._auto_clear_spin.setEnabled(self._auto_clear_checkbox.isChecked())
 
         layout.addWidget(retention_group)
 
@@ -2456,15 +3083,20 @@ class SettingsDialog(QtWidgets.QDialog):
             lambda: self._pick_color("Endfarbe", False)
         )
 
-        self._result_settings: Optional[AppSettings] = None
+        self._load(self._settings)
+
+    def load_settings(self, settings: AppSettings) -> None:
+        """Show ``settings`` in the existing widgets so the dialog can be reused."""
+        self._settings = settings.copy()
+        self._result_settings = None
+        self._load(self._settings)
 
     def result_settings(self) -> Optional[AppSettings]:
         return self._result_settings
 
-    def _create_color_button(self, color: str) -> QtWidgets.QPushButton:
+    def _create_color_button(self) -> QtWidgets.QPushButton:
         btn = QtWidgets.QPushButton()
         btn.setFixedSize(52, 24)
-        btn.setStyleSheet(self._color_stylesheet(color))
         return btn
 
     def _color_stylesheet(self, color: str) -> str:
@@ -2497,46 +3129,49 @@ class SettingsDialog(QtWidgets.QDialog):
                 )
 
     def _reset_defaults(self) -> None:
-        defaults = DEFAULT_SETTINGS.copy()
-        self._scale_slider.setValue(int(defaults.toast_scale * 100))
-        self._duration_spin.setValue(defaults.toast_duration_ms)
-        self._accent_start_color = defaults.accent_start
-        self._accent_end_color = defaults.accent_end
+        self._load(DEFAULT_SETTINGS)
+
+    def _load(self, settings: AppSettings) -> None:
+        self._scale_slider.setValue(int(settings.toast_scale * 100))
+        self._scale_value_label.setText(f"{self._scale_slider.value()} %")
+        self._duration_spin.setValue(settings.toast_duration_ms)
+        self._accent_start_color = settings.accent_start
+        self._accent_end_color = settings.accent_end
         self._accent_start_button.setStyleSheet(
             self._color_stylesheet(self._accent_start_color)
         )
         self._accent_end_button.setStyleSheet(
             self._color_stylesheet(self._accent_end_color)
         )
-        self._prev_editor.setSequence(defaults.hotkey_prev)
-        self._next_editor.setSequence(defaults.hotkey_next)
-        self._show_editor.setSequence(defaults.hotkey_show_history)
+        self._prev_editor.setSequence(settings.hotkey_prev)
+        self._next_editor.setSequence(settings.hotkey_next)
+        self._show_editor.setSequence(settings.hotkey_show_history)
         try:
-            self._qr_editor.setSequence(getattr(defaults, 'hotkey_qr', 'Alt+Shift+Q'))
+            self._qr_editor.setSequence(getattr(settings, 'hotkey_qr', 'Alt+Shift+Q'))
         except Exception:
             pass
-        self._preview_checkbox.setChecked(defaults.show_preview_overlay)
-        self._capture_checkbox.setChecked(defaults.capture_protection_enabled)
-        self._auto_clear_checkbox.setChecked(defaults.auto_clear_enabled)
-        self._auto_clear_spin.setValue(defaults.auto_clear_interval_minutes)
+        self._preview_checkbox.setChecked(settings.show_preview_overlay)
+        self._capture_checkbox.setChecked(settings.capture_protection_enabled)
+        self._auto_clear_checkbox.setChecked(settings.auto_clear_enabled)
+        self._auto_clear_spin.setValue(settings.auto_clear_interval_minutes)
         self._auto_clear_spin.setEnabled(self._auto_clear_checkbox.isChecked())
-        theme_index = self._theme_combo.findData(defaults.theme_mode)
+        theme_index = self._theme_combo.findData(settings.theme_mode)
         if theme_index >= 0:
             self._theme_combo.setCurrentIndex(theme_index)
-        overlay_theme_index = self._overlay_theme_combo.findData(defaults.overlay_theme)
+        overlay_theme_index = self._overlay_theme_combo.findData(settings.overlay_theme)
         if overlay_theme_index >= 0:
             self._overlay_theme_combo.setCurrentIndex(overlay_theme_index)
-        self._opacity_slider.setValue(defaults.overlay_opacity)
-        self._opacity_value_label.setText(f"{defaults.overlay_opacity}%")
-        self._follow_checkbox.setChecked(defaults.overlay_follow_mouse)
-        anchor_index = self._anchor_combo.findData(defaults.overlay_anchor)
+        self._opacity_slider.setValue(settings.overlay_opacity)
+        self._opacity_value_label.setText(f"{settings.overlay_opacity}%")
+        self._follow_checkbox.setChecked(settings.overlay_follow_mouse)
+        anchor_index = self._anchor_combo.findData(settings.overlay_anchor)
         if anchor_index >= 0:
             self._anchor_combo.setCurrentIndex(anchor_index)
         self._anchor_combo.setEnabled(not self._follow_checkbox.isChecked())
-        self._offset_x_spin.setValue(defaults.overlay_offset_x)
-        self._offset_y_spin.setValue(defaults.overlay_offset_y)
-        self._anim_in_spin.setValue(defaults.animation_in_ms)
-        self._anim_out_spin.setValue(defaults.animation_out_ms)
+        self._offset_x_spin.setValue(settings.overlay_offset_x)
+        self._offset_y_spin.setValue(settings.overlay_offset_y)
+        self._anim_in_spin.setValue(settings.animation_in_ms)
+        self._anim_out_spin.setValue(settings.animation_out_ms)
 
     def _accept(self) -> None:
         try:
@@ -2592,25 +3227,58 @@ class HotkeyManager(QtCore.QObject):
 
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
-        self._ids: List[int] = []
+        # hotkey id -> (modifiers, key) currently registered with Windows
+        self._registered: Dict[int, Tuple[int, int]] = {}
         self._event_filter = _NativeHotkeyEventFilter(self.hotkeyTriggered)
         QtWidgets.QApplication.instance().installNativeEventFilter(self._event_filter)
 
     def register_hotkey(self, hotkey_id: int, modifiers: int, key: int) -> None:
         if not ctypes.windll.user32.RegisterHotKey(None, hotkey_id, modifiers, key):
             raise RuntimeError(f"Hotkey {hotkey_id} konnte nicht registriert werden")
-        self._ids.append(hotkey_id)
+        self._registered[hotkey_id] = (modifiers, key)
+
+    def rebind(self, bindings: Dict[int, Tuple[int, int]]) -> Dict[int, RuntimeError]:
+        """Make the registered hotkeys match ``bindings``, touching only changed ids.
+
+        Returns the ids that could not be registered together with their error.
+        """
+        stale = [
+            hotkey_id
+            for hotkey_id, binding in self._registered.items()
+            if bindings.get(hotkey_id) != binding
+        ]
+        # release every stale id first, so that swapping two combinations cannot collide
+        for hotkey_id in stale:
+            self.unregister_hotkey(hotkey_id)
+        failed: Dict[int, RuntimeError] = {}
+        for hotkey_id, (modifiers, key) in bindings.items():
+            if hotkey_id in self._registered:
+                continue
+            try:
+                self.register_hotkey(hotkey_id, modifiers, key)
+            except RuntimeError as exc:
+                failed[hotkey_id] = exc
+        return failed
+
+    def unregister_hotkey(self, hotkey_id: int) -> None:
+        if self._registered.pop(hotkey_id, None) is not None:
+            ctypes.windll.user32.UnregisterHotKey(None, hotkey_id)
 
     def unregister_all(self) -> None:
-        for hotkey_id in self._ids:
+        for hotkey_id in self._registered:
             ctypes.windll.user32.UnregisterHotKey(None, hotkey_id)
-        self._ids.clear()
+        self._registered.clear()
 
     def __del__(self) -> None:
         self.unregister_all()
 
 
 class _NativeHotkeyEventFilter(QtCore.QAbstractNativeEventFilter):
+    # Every message pumped through Qt passes this filter; read the message id straight
+    # from the MSG struct and only touch wParam for WM_HOTKEY.
+    _MESSAGE_OFFSET = wintypes.MSG.message.offset
+    _WPARAM_OFFSET = wintypes.MSG.wParam.offset
+
     def __init__(self, signal) -> None:
         super().__init__()
         self._signal = signal
@@ -2622,11 +3290,10 @@ class _NativeHotkeyEventFilter(QtCore.QAbstractNativeEventFilter):
             pointer = int(message)
         except (TypeError, ValueError):
             return False, 0
-        msg = ctypes.cast(pointer, ctypes.POINTER(wintypes.MSG)).contents
-        if msg.message == HotkeyManager.WM_HOTKEY:
-            self._signal.emit(int(msg.wParam))
-            return True, 0
-        return False, 0
+        if wintypes.UINT.from_address(pointer + self._MESSAGE_OFFSET).value != HotkeyManager.WM_HOTKEY:
+            return False, 0
+        self._signal.emit(wintypes.WPARAM.from_address(pointer + self._WPARAM_OFFSET).value)
+        return True, 0
 
 
 VK_CODE_MAP = {
@@ -2655,7 +3322,24 @@ VK_CODE_MAP = {
     "POINT": 0xBE,
 }
 
+# Every key name a hotkey may end in, resolved with a single lookup
+_KEY_CODES = MappingProxyType(
+    {
+        **VK_CODE_MAP,
+        **{char: ord(char) for char in string.ascii_uppercase},
+        **{char: ord(char) for char in string.digits},
+        **{f"F{index}": 0x70 + index - 1 for index in range(1, 25)},
+    }
+)
 
+
+@functools.lru_cache(maxsize=16)
+def _key_sequence(sequence: str) -> QtGui.QKeySequence:
+    # QShortcut.setKey copies the value, so one parsed instance can be shared
+    return QtGui.QKeySequence(sequence)
+
+
+@functools.lru_cache(maxsize=64)
 def parse_hotkey(sequence: str) -> Tuple[int, int]:
     if not sequence:
         raise ValueError("Hotkey darf nicht leer sein.")
@@ -2687,18 +3371,10 @@ def parse_hotkey(sequence: str) -> Tuple[int, int]:
 
 
 def _resolve_key_code(part: str) -> int:
-    upper = part.upper()
-    if len(upper) == 1 and upper in string.ascii_uppercase:
-        return ord(upper)
-    if len(upper) == 1 and upper in string.digits:
-        return ord(upper)
-    if upper in VK_CODE_MAP:
-        return VK_CODE_MAP[upper]
-    if upper.startswith("F") and upper[1:].isdigit():
-        index = int(upper[1:])
-        if 1 <= index <= 24:
-            return 0x70 + (index - 1)
-    raise ValueError(f"Unbekannte Taste '{part}' in Hotkey.")
+    code = _KEY_CODES.get(part.upper())
+    if code is None:
+        raise ValueError(f"Unbekannte Taste '{part}' in Hotkey.")
+    return code
 
 
 WDA_NONE = 0x00000000
@@ -2706,6 +3382,12 @@ WDA_MONITOR = 0x00000001
 WDA_EXCLUDEFROMCAPTURE = 0x00000011
 
 
+# widget -> (hwnd, enabled) last applied; a recreated native window gets a new hwnd
+_capture_protection_applied: "weakref.WeakKeyDictionary[QtWidgets.QWidget, Tuple[int, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def set_window_capture_protection(widget: QtWidgets.QWidget, enabled: bool) -> None:
     if widget is None or not sys.platform.startswith("win"):
         return
@@ -2715,6 +3397,8 @@ def set_window_capture_protection(widget: QtWidgets.QWidget, enabled: bool) -> N
         return
     if not hwnd:
         return
+    if _capture_protection_applied.get(widget) == (hwnd, enabled):
+        return
     try:
         user32 = ctypes.windll.user32
     except AttributeError:
@@ -2723,6 +3407,7 @@ def set_window_capture_protection(widget: QtWidgets.QWidget, enabled: bool) -> N
     if not user32.SetWindowDisplayAffinity(hwnd, affinity):
         if enabled:
             user32.SetWindowDisplayAffinity(hwnd, WDA_MONITOR)
+    _capture_protection_applied[widget] = (hwnd, enabled)
 
 
 def resource_path(name: str) -> Path:
@@ -2781,6 +3466,7 @@ def ensure_autostart(script_path: Path) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def load_app_icon() -> QtGui.QIcon:
     for path in (ICON_ICO_PATH, ICON_PNG_PATH):
         if path.exists():
@@ -2794,20 +3480,23 @@ def build_tray_icon(settings: AppSettings) -> QtGui.QIcon:
     icon = load_app_icon()
     if not icon.isNull():
         return icon
+    return _accent_icon(
+        _normalize_color(settings.accent_start, "#4cf0c7"),
+        _normalize_color(settings.accent_end, "#ef38ef"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _accent_icon(start_hex: str, end_hex: str) -> QtGui.QIcon:
+    """Fallback icon drawn from the accent colors, used when no icon file ships."""
     pixmap = QtGui.QPixmap(64, 64)
     pixmap.fill(QtCore.Qt.transparent)
 
     painter = QtGui.QPainter(pixmap)
     painter.setRenderHint(QtGui.QPainter.Antialiasing)
     gradient = QtGui.QLinearGradient(0, 0, 64, 64)
-    start = QtGui.QColor(settings.accent_start)
-    if not start.isValid():
-        start = QtGui.QColor("#4cf0c7")
-    end = QtGui.QColor(settings.accent_end)
-    if not end.isValid():
-        end = QtGui.QColor("#ef38ef")
-    gradient.setColorAt(0, start)
-    gradient.setColorAt(1, end)
+    gradient.setColorAt(0, QtGui.QColor(start_hex))
+    gradient.setColorAt(1, QtGui.QColor(end_hex))
     painter.setBrush(QtGui.QBrush(gradient))
     painter.setPen(QtGui.QPen(QtGui.QColor("#ffffff"), 2))
     painter.drawRoundedRect(4, 4, 56, 56, 16, 16)
@@ -2827,64 +3516,145 @@ def window_icon(settings: AppSettings) -> QtGui.QIcon:
     return icon
 
 
+class _SettingsSaveTask(QtCore.QRunnable):
+    def __init__(self, settings: AppSettings, path: Path) -> None:
+        super().__init__()
+        self._settings = settings
+        self._path = path
+
+    def run(self) -> None:
+        try:
+            self._settings.save(self._path)
+        except Exception:
+            pass
+
+
 class MainController(QtCore.QObject):
     HOTKEY_NEXT = 1001
     HOTKEY_PREV = 1002
     HOTKEY_SHOW = 1003
     HOTKEY_QR = 1004
 
+    # settings fields each part of apply_settings depends on
+    _THEME_FIELDS = frozenset({"theme_mode", "accent_start", "accent_end"})
+    _HOTKEY_FIELDS = frozenset({"hotkey_prev", "hotkey_next", "hotkey_show_history", "hotkey_qr"})
+    _TOAST_FIELDS = frozenset(
+        {
+            "theme_mode",
+            "accent_start",
+            "accent_end",
+            "toast_duration_ms",
+            "toast_scale",
+            "show_preview_overlay",
+            "overlay_theme",
+            "overlay_opacity",
+            "overlay_follow_mouse",
+            "overlay_anchor",
+            "overlay_offset_x",
+            "overlay_offset_y",
+            "animation_in_ms",
+            "animation_out_ms",
+        }
+    )
+    _HISTORY_WINDOW_FIELDS = frozenset({"theme_mode", "accent_start", "accent_end", "hotkey_prev", "hotkey_next"})
+    _MAIN_WINDOW_FIELDS = _THEME_FIELDS | _HOTKEY_FIELDS | {"show_preview_overlay", "capture_protection_enabled"}
+
     def __init__(self, app: QtWidgets.QApplication, settings: AppSettings) -> None:
         super().__init__()
         self._app = app
         self._settings = settings.sanitized()
         self._main_window: Optional["MainWindow"] = None
+        self._history_window: Optional[HistoryWindow] = None
+        self._qr_dialog: Optional[QrCodeDialog] = None
+        self._settings_dialog: Optional[SettingsDialog] = None
+        # mirrors ClipboardHistory.current_item(), kept current through selectionChanged
+        self._current_item: Optional[ClipboardItem] = None
         QtWidgets.QApplication.setQuitOnLastWindowClosed(False)
+        # Settings writes are debounced: a burst of changes ends in a single save.
+        self._settings_save_timer = QtCore.QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(250)
+        self._settings_save_timer.timeout.connect(self._save_settings_now)
+        # Serializing and writing happens off the GUI thread, one save at a time.
+        self._settings_pool = QtCore.QThreadPool(self)
+        self._settings_pool.setMaxThreadCount(1)
+        app.aboutToQuit.connect(self.flush_settings)
+        # built on the first preview; many sessions never show one
+        self._toast: Optional[PreviewToast] = None
+
+    def _get_toast(self) -> PreviewToast:
+        if self._toast is None:
+            self._toast = PreviewToast(self._settings)
+        return self._toast
+
+    def _hide_toast(self) -> None:
+        if self._toast is not None:
+            self._toast.hide()
 
-        self._storage = EncryptedStorage(app_data_dir() / HISTORY_FILE_NAME)
-        self._clipboard_history = ClipboardHistory(
-            clipboard=app.clipboard(), storage=self._storage
-        )
-        self._history_window: Optional[HistoryWindow] = None
+    # Subsystems below are created on first access (at the latest by warm_up),
+    # so that constructing the controller does not delay the first frame.
+
+    @functools.cached_property
+    def _clipboard_history(self) -> ClipboardHistory:
+        storage = EncryptedStorage(app_data_dir() / HISTORY_FILE_NAME)
+        history = ClipboardHistory(clipboard=self._app.clipboard(), storage=storage)
+        # Signals raised on the GUI thread for every copy, click or hotkey are
+        # connected directly; AutoConnection would re-check the thread per emit.
+        history.selectionChanged.connect(self._on_selection_change, QtCore.Qt.DirectConnection)
+        self._current_item = history.current_item()
+        return history
+
+    @functools.cached_property
+    def _show_history_shortcut(self) -> QtGui.QShortcut:
         self._shortcut_host = QtWidgets.QWidget()
         self._shortcut_host.setAttribute(QtCore.Qt.WA_DontShowOnScreen, True)
         self._shortcut_host.hide()
-        self._show_history_shortcut = QtGui.QShortcut(
-            QtGui.QKeySequence(self._settings.hotkey_show_history), self._shortcut_host
+        shortcut = QtGui.QShortcut(
+            _key_sequence(self._settings.hotkey_show_history), self._shortcut_host
         )
-        self._show_history_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
-        self._show_history_shortcut.activated.connect(self._show_history)
-
-        self._auto_clear_timer = QtCore.QTimer(self)
-        self._auto_clear_timer.setSingleShot(False)
-        self._auto_clear_timer.timeout.connect(self._auto_clear_history)
-        self._configure_auto_clear_timer()
-
-        self._toast = PreviewToast(self._settings)
-
-        self._tray = QtWidgets.QSystemTrayIcon(build_tray_icon(self._settings))
-        self._tray.setToolTip(APP_DISPLAY_NAME)
+        shortcut.setContext(QtCore.Qt.ApplicationShortcut)
+        shortcut.activated.connect(self._show_history)
+        return shortcut
+
+    @functools.cached_property
+    def _auto_clear_timer(self) -> QtCore.QTimer:
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(False)
+        timer.timeout.connect(self._auto_clear_history)
+        return timer
+
+    @functools.cached_property
+    def _tray(self) -> QtWidgets.QSystemTrayIcon:
+        tray = QtWidgets.QSystemTrayIcon(build_tray_icon(self._settings))
+        tray.setToolTip(APP_DISPLAY_NAME)
         tray_menu = QtWidgets.QMenu()
         open_action = tray_menu.addAction("Verlauf anzeigen")
         open_action.triggered.connect(self._show_history)
         tray_menu.addSeparator()
         quit_action = tray_menu.addAction("Beenden")
         quit_action.triggered.connect(self._quit)
-        self._tray.setContextMenu(tray_menu)
-        self._tray.activated.connect(self._on_tray_activated)
+        tray.setContextMenu(tray_menu)
+        tray.activated.connect(self._on_tray_activated, QtCore.Qt.DirectConnection)
+        return tray
+
+    @functools.cached_property
+    def _hotkeys(self) -> "HotkeyManager":
+        hotkeys = HotkeyManager()
+        hotkeys.hotkeyTriggered.connect(self._process_hotkey, QtCore.Qt.DirectConnection)
+        return hotkeys
+
+    def warm_up(self) -> None:
+        """Bring up tray, hotkeys and clipboard capture once the event loop runs."""
         self._tray.show()
-
-        self._hotkeys = HotkeyManager()
-        self._hotkeys.hotkeyTriggered.connect(self._process_hotkey)
+        self._show_history_shortcut.setEnabled(True)
         self._register_hotkeys()
-
-        self._clipboard_history.selectionChanged.connect(self._on_selection_change)
+        self._configure_auto_clear_timer()
+        # first use of the history: creating it starts capture and seeds _current_item
         current = self._clipboard_history.current_item()
         if current and self._settings.show_preview_overlay:
-            self._toast.show_preview(current)
-        self._qr_dialog: Optional[QrCodeDialog] = None
+            self._get_toast().show_preview(current)
 
     def _register_hotkeys(self) -> None:
-        self._hotkeys.unregister_all()
         mappings = [
             (self.HOTKEY_PREV, self._settings.hotkey_prev, DEFAULT_SETTINGS.hotkey_prev),
             (self.HOTKEY_NEXT, self._settings.hotkey_next, DEFAULT_SETTINGS.hotkey_next),
@@ -2900,6 +3670,8 @@ class MainController(QtCore.QObject):
             ),
         ]
         changed = False
+        bindings: Dict[int, Tuple[int, int]] = {}
+        fallbacks: Dict[int, str] = {}
         for hotkey_id, sequence, fallback in mappings:
             try:
                 modifiers, key = parse_hotkey(sequence)
@@ -2914,30 +3686,45 @@ class MainController(QtCore.QObject):
                 elif hotkey_id == self.HOTKEY_QR:
                     self._settings.hotkey_qr = fallback
                 changed = True
-            try:
-                self._hotkeys.register_hotkey(hotkey_id, modifiers, key)
-            except RuntimeError as exc:
-                QtWidgets.QMessageBox.warning(
-                    None,
-                    "Hotkey-Fehler",
-                    f"{exc}\nDer Hotkey wird auf den Standardwert zurueckgesetzt.",
-                )
-                modifiers, key = parse_hotkey(fallback)
-                if hotkey_id == self.HOTKEY_PREV:
-                    self._settings.hotkey_prev = fallback
-                elif hotkey_id == self.HOTKEY_NEXT:
-                    self._settings.hotkey_next = fallback
-                elif hotkey_id == self.HOTKEY_SHOW:
-                    self._settings.hotkey_show_history = fallback
-                elif hotkey_id == self.HOTKEY_QR:
-                    self._settings.hotkey_qr = fallback
-                changed = True
-                self._hotkeys.register_hotkey(hotkey_id, modifiers, key)
+            bindings[hotkey_id] = (modifiers, key)
+            fallbacks[hotkey_id] = fallback
+        for hotkey_id, exc in self._hotkeys.rebind(bindings).items():
+            fallback = fallbacks[hotkey_id]
+            QtWidgets.QMessageBox.warning(
+                None,
+                "Hotkey-Fehler",
+                f"{exc}\nDer Hotkey wird auf den Standardwert zurueckgesetzt.",
+            )
+            modifiers, key = parse_hotkey(fallback)
+            if hotkey_id == self.HOTKEY_PREV:
+                self._settings.hotkey_prev = fallback
+            elif hotkey_id == self.HOTKEY_NEXT:
+                self._settings.hotkey_next = fallback
+            elif hotkey_id == self.HOTKEY_SHOW:
+                self._settings.hotkey_show_history = fallback
+            elif hotkey_id == self.HOTKEY_QR:
+                self._settings.hotkey_qr = fallback
+            changed = True
+            self._hotkeys.register_hotkey(hotkey_id, modifiers, key)
         if changed:
-            try:
-                self._settings.save(settings_path())
-            except Exception:
-                pass
+            self._schedule_settings_save()
+
+    def _schedule_settings_save(self) -> None:
+        self._settings_save_timer.start()
+
+    def _save_settings_now(self) -> None:
+        self._settings_save_timer.stop()
+        try:
+            path = settings_path()
+        except Exception:
+            return
+        self._settings_pool.start(_SettingsSaveTask(self._settings.copy(), path))
+
+    def flush_settings(self) -> None:
+        """Write a pending, debounced settings save and wait until it is on disk."""
+        if self._settings_save_timer.isActive():
+            self._save_settings_now()
+        self._settings_pool.waitForDone()
 
     def _apply_capture_protection(self) -> None:
         if self._history_window is not None:
@@ -2967,38 +3754,42 @@ class MainController(QtCore.QObject):
         return self._settings.copy()
 
     def apply_settings(self, new_settings: AppSettings) -> None:
+        old_settings = self._settings
         self._settings = new_settings.sanitized()
-        try:
-            self._settings.save(settings_path())
-        except Exception:
-            pass
-        apply_app_theme(self._app, self._settings)
-        self._toast.apply_settings(self._settings)
-        if not self._settings.show_preview_overlay:
-            self._toast.hide()
-        else:
-            current = self._clipboard_history.current_item()
-            if current:
-                self._toast.show_preview(current)
-        if self._history_window is not None:
+        changed = old_settings.diff(self._settings)
+        if not changed:
+            return
+        self._schedule_settings_save()
+        if changed & self._THEME_FIELDS:
+            apply_app_theme(self._app, self._settings)
+        if self._toast is not None:
+            self._toast.apply_settings(self._settings)
+        if changed & self._TOAST_FIELDS:
+            if not self._settings.show_preview_overlay:
+                self._hide_toast()
+            elif self._current_item:
+                self._get_toast().show_preview(self._current_item)
+        if self._history_window is not None and changed & self._HISTORY_WINDOW_FIELDS:
             self._history_window.apply_settings(self._settings)
-        if self._main_window:
+        if self._main_window and changed & self._MAIN_WINDOW_FIELDS:
             self._main_window.apply_settings(self._settings)
-        self._tray.setIcon(build_tray_icon(self._settings))
-        self._tray.setToolTip(APP_DISPLAY_NAME)
-        self._show_history_shortcut.setKey(
-            QtGui.QKeySequence(self._settings.hotkey_show_history)
-        )
-        self._apply_capture_protection()
-        self._configure_auto_clear_timer()
-        self._register_hotkeys()
+        if changed & {"accent_start", "accent_end"}:
+            self._tray.setIcon(build_tray_icon(self._settings))
+        if "hotkey_show_history" in changed:
+            self._show_history_shortcut.setKey(_key_sequence(self._settings.hotkey_show_history))
+        if "capture_protection_enabled" in changed:
+            self._apply_capture_protection()
+        if changed & {"auto_clear_enabled", "auto_clear_interval_minutes"}:
+            self._configure_auto_clear_timer()
+        if changed & self._HOTKEY_FIELDS:
+            self._register_hotkeys()
 
     def _ensure_history_window(self) -> HistoryWindow:
         if self._history_window is None:
             window = HistoryWindow(
                 self._clipboard_history, self._settings, self.open_settings_dialog
             )
-            window.itemActivated.connect(self._on_item_activated)
+            window.itemActivated.connect(self._on_item_activated, QtCore.Qt.DirectConnection)
             set_window_capture_protection(window, self._settings.capture_protection_enabled)
             window.hide()
             self._history_window = window
@@ -3007,7 +3798,15 @@ class MainController(QtCore.QObject):
     def open_settings_dialog(self) -> None:
         history_window = self._history_window
         parent = history_window if history_window and history_window.isVisible() else self._main_window
-        dialog = SettingsDialog(parent or self._ensure_history_window(), self._settings)
+        parent = parent or self._ensure_history_window()
+        # built once; later openings only load the current values into the widgets
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = self._settings_dialog = SettingsDialog(parent, self._settings)
+        else:
+            if dialog.parentWidget() is not parent:
+                dialog.setParent(parent, dialog.windowFlags())
+            dialog.load_settings(self._settings)
         if dialog.exec() == QtWidgets.QDialog.Accepted:
             result = dialog.result_settings()
             if result:
@@ -3016,10 +3815,7 @@ class MainController(QtCore.QObject):
     def mark_first_run_completed(self) -> None:
         if self._settings.first_run:
             self._settings.first_run = False
-            try:
-                self._settings.save(settings_path())
-            except Exception:
-                pass
+            self._schedule_settings_save()
 
     def _process_hotkey(self, hotkey_id: int) -> None:
         if hotkey_id == self.HOTKEY_NEXT:
@@ -3030,9 +3826,8 @@ class MainController(QtCore.QObject):
             self._show_history()
             return
         elif hotkey_id == self.HOTKEY_QR:
-            item = self._clipboard_history.current_item()
-            if item:
-                self._show_qr_for_item(item)
+            if self._current_item:
+                self._show_qr_for_item(self._current_item)
             return
         else:
             return
@@ -3040,9 +3835,9 @@ class MainController(QtCore.QObject):
         if item:
             self._clipboard_history.push_to_clipboard(item)
             if self._settings.show_preview_overlay:
-                self._toast.show_preview(item)
+                self._get_toast().show_preview(item)
             else:
-                self._toast.hide()
+                self._hide_toast()
 
     def _show_qr_for_item(self, item: ClipboardItem) -> None:
         text = qr_text_for_item(item)
@@ -3057,17 +3852,18 @@ class MainController(QtCore.QObject):
         self._qr_dialog.raise_()
 
     def _on_selection_change(self, item: Optional[ClipboardItem]) -> None:
+        self._current_item = item
         if item and self._settings.show_preview_overlay:
-            self._toast.show_preview(item)
+            self._get_toast().show_preview(item)
         elif not self._settings.show_preview_overlay:
-            self._toast.hide()
+            self._hide_toast()
 
     def _on_item_activated(self, item: ClipboardItem) -> None:
         self._clipboard_history.push_to_clipboard(item)
         if self._settings.show_preview_overlay:
-            self._toast.show_preview(item)
+            self._get_toast().show_preview(item)
         else:
-            self._toast.hide()
+            self._hide_toast()
 
     def _show_history(self) -> None:
         window = self._ensure_history_window()
@@ -3083,11 +3879,54 @@ class MainController(QtCore.QObject):
             self._show_history()
 
     def _quit(self) -> None:
+        self.flush_settings()
         self._hotkeys.unregister_all()
         self._tray.hide()
         self._app.quit()
 
 
+_MAIN_HERO_TEMPLATE = string.Template(
+    """
+QFrame#welcomeCard {
+    background-color: $background;
+    border: 1px solid $border;
+    border-radius: 18px;
+}
+"""
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _main_window_feature_text(
+    hotkey_prev: str,
+    hotkey_next: str,
+    hotkey_show_history: str,
+    hotkey_qr: str,
+    show_preview_overlay: bool,
+    capture_protection_enabled: bool,
+) -> str:
+    """Feature list shown on the main window's hero card."""
+    preview_state = "aktiv" if show_preview_overlay else "deaktiviert"
+    capture_state = "aktiv" if capture_protection_enabled else "deaktiviert"
+    return (
+        f"\u2022 {display_hotkey(hotkey_prev)} / {display_hotkey(hotkey_next)}: Verlauf wechseln\n"
+        f"\u2022 {display_hotkey(hotkey_show_history)}: Verlauf oeffnen\n"
+        f"\u2022 {display_hotkey(hotkey_qr)}: QR-Code anzeigen\n"
+        f"\u2022 Vorschau-Overlay: {preview_state}\n"
+        f"\u2022 Aufnahmeschutz: {capture_state}\n"
+        "\u2022 Enter in der Liste: Auswahl uebernehmen"
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _main_window_stylesheet(accent_hex: str, dark_mode: bool) -> str:
+    """Sheet for the main window's hero card; its labels are styled by the app sheet."""
+    return _MAIN_HERO_TEMPLATE.substitute(
+        background="rgba(24, 26, 40, 235)" if dark_mode else "rgba(255, 255, 255, 240)",
+        border=color_to_rgba(QtGui.QColor(accent_hex), 0.4 if dark_mode else 0.22),
+    )
+
+
 class MainWindow(QtWidgets.QWidget):
     def __init__(self, controller: MainController) -> None:
         super().__init__()
@@ -3099,12 +3938,25 @@ class MainWindow(QtWidgets.QWidget):
             | QtCore.Qt.WindowMinimizeButtonHint
         )
         self.setWindowTitle(APP_DISPLAY_NAME)
-        self.setWindowIcon(window_icon(self._settings))
+        # the icon and styles are seeded once by MainController.register_main_window
         self.resize(360, 260)
 
         self._drag_active = False
         self._drag_offset = QtCore.QPoint()
-
+        # Outside the first run the window usually stays hidden in the tray;
+        # its widgets are built when it is first shown.
+        self._ui_built = False
+
+    def setVisible(self, visible: bool) -> None:
+        if visible and not self._ui_built:
+            self._build_ui()
+        super().setVisible(visible)
+
+    def _build_ui(self) -> None:
+        self._ui_built = True
+        # sheet last applied to the hero card, see _main_window_stylesheet
+        self._hero_sheet: Optional[str] = None
+        self._feature_text: Optional[str] = None
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
@@ -3116,8 +3968,9 @@ class MainWindow(QtWidgets.QWidget):
         title_layout.setSpacing(10)
 
         self._title_icon = QtWidgets.QLabel()
-        icon_pixmap = window_icon(self._settings).pixmap(20, 20)
-        self._title_icon.setPixmap(icon_pixmap)
+        icon = window_icon(self._settings)
+        self._title_icon_source = icon
+        self._title_icon.setPixmap(icon.pixmap(20, 20))
         title_layout.addWidget(self._title_icon)
 
         self._title_label = QtWidgets.QLabel(APP_DISPLAY_NAME)
@@ -3146,60 +3999,25 @@ class MainWindow(QtWidgets.QWidget):
         hero_layout.setSpacing(10)
 
         self._hero_title = QtWidgets.QLabel(APP_DISPLAY_NAME)
+        self._hero_title.setObjectName("heroTitle")
         self._hero_title.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-        self._hero_title.setStyleSheet(
-            """
-            QLabel {
-                font-size: 20px;
-                font-weight: 700;
-                background-color: transparent;
-            }
-            """
-        )
         hero_layout.addWidget(self._hero_title)
 
         self._hero_caption = QtWidgets.QLabel(
             f"{APP_DISPLAY_NAME} begleitet dich immer im Hintergrund und bleibt ueber das Tray erreichbar."
         )
+        self._hero_caption.setObjectName("heroCaption")
         self._hero_caption.setWordWrap(True)
-        self._hero_caption.setStyleSheet(
-            """
-            QLabel {
-                font-size: 12px;
-                color: rgba(245, 247, 255, 150);
-                background-color: transparent;
-            }
-            """
-        )
         hero_layout.addWidget(self._hero_caption)
 
         self._feature_label = QtWidgets.QLabel()
-        self._feature_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 12px;
-                color: rgba(245, 247, 255, 190);
-                background-color: transparent;
-            }
-            """
-        )
+        self._feature_label.setObjectName("featureLabel")
         self._feature_label.setAlignment(QtCore.Qt.AlignLeft)
         hero_layout.addWidget(self._feature_label)
 
         self._status_chip = QtWidgets.QLabel(f"{APP_DISPLAY_NAME} laeuft im Hintergrund")
+        self._status_chip.setObjectName("statusChip")
         self._status_chip.setAlignment(QtCore.Qt.AlignCenter)
-        self._status_chip.setStyleSheet(
-            """
-            QLabel {
-                border-radius: 12px;
-                padding: 6px 12px;
-                background-color: rgba(44, 182, 125, 70);
-                color: rgba(44, 182, 125, 210);
-                font-weight: 600;
-                letter-spacing: 0.5px;
-            }
-            """
-        )
         hero_layout.addWidget(self._status_chip)
         layout.addWidget(self._hero)
 
@@ -3209,8 +4027,6 @@ class MainWindow(QtWidgets.QWidget):
         self._history_button = QtWidgets.QPushButton("Verlauf oeffnen")
         self._history_button.clicked.connect(self._controller.show_history)
         self._history_button.setProperty("accent", True)
-        self._history_button.style().unpolish(self._history_button)
-        self._history_button.style().polish(self._history_button)
         action_row.addWidget(self._history_button, 1)
 
         self._hide_button = QtWidgets.QPushButton("Schliessen")
@@ -3226,73 +4042,32 @@ class MainWindow(QtWidgets.QWidget):
 
     def apply_settings(self, settings: AppSettings) -> None:
         self._settings = settings
-        start = QtGui.QColor(settings.accent_start)
-        if not start.isValid():
-            start = QtGui.QColor("#7f5af0")
-        dark_mode = settings.theme_mode == "dark"
-        border = color_to_rgba(start, 0.4 if dark_mode else 0.22)
-        hero_bg = "rgba(24, 26, 40, 235)" if dark_mode else "rgba(255, 255, 255, 240)"
-        self._hero.setStyleSheet(
-            f"""
-            QFrame#welcomeCard {{
-                background-color: {hero_bg};
-                border: 1px solid {border};
-                border-radius: 18px;
-            }}
-            """
-        )
-        self.setWindowIcon(window_icon(settings))
-        self._title_icon.setPixmap(window_icon(settings).pixmap(20, 20))
-        self._status_chip.setText(f"{APP_DISPLAY_NAME} laeuft im Hintergrund")
-        preview_state = "aktiv" if settings.show_preview_overlay else "deaktiviert"
-        capture_state = "aktiv" if settings.capture_protection_enabled else "deaktiviert"
-        lines = [
-            f"\u2022 {display_hotkey(settings.hotkey_prev)} / {display_hotkey(settings.hotkey_next)}: Verlauf wechseln",
-            f"\u2022 {display_hotkey(settings.hotkey_show_history)}: Verlauf oeffnen",
-            f"\u2022 {display_hotkey(getattr(settings, 'hotkey_qr', 'Alt+Shift+Q'))}: QR-Code anzeigen",
-            f"\u2022 Vorschau-Overlay: {preview_state}",
-            f"\u2022 Aufnahmeschutz: {capture_state}",
-            "\u2022 Enter in der Liste: Auswahl uebernehmen",
-        ]
-        self._feature_label.setText("\n".join(lines))
-        title_color = "#f5f7ff" if dark_mode else "#1f2238"
-        caption_color = (
-            "rgba(245, 247, 255, 150)" if dark_mode else "rgba(70, 75, 95, 190)"
+        icon = window_icon(settings)
+        self.setWindowIcon(icon)
+        if not self._ui_built:
+            return  # _build_ui applies the latest settings
+        sheet = _main_window_stylesheet(
+            settings.accent_start_qcolor().name(), settings.theme_mode == "dark"
         )
-        feature_color = (
-            "rgba(245, 247, 255, 190)" if dark_mode else "rgba(54, 59, 80, 200)"
-        )
-        self._hero_title.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 20px;
-                font-weight: 700;
-                color: {title_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        self._hero_caption.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 12px;
-                color: {caption_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        self._feature_label.setStyleSheet(
-            f"""
-            QLabel {{
-                font-size: 12px;
-                color: {feature_color};
-                background-color: transparent;
-            }}
-            """
-        )
-        for button in (self._history_button, self._hide_button):
-            button.style().unpolish(button)
-            button.style().polish(button)
+        # an identical sheet would still be reparsed and the card restyled
+        if sheet != self._hero_sheet:
+            self._hero_sheet = sheet
+            self._hero.setStyleSheet(sheet)
+        # icons are cached, so the same object means the same image; skip re-rasterizing it
+        if icon is not self._title_icon_source:
+            self._title_icon_source = icon
+            self._title_icon.setPixmap(icon.pixmap(20, 20))
+        text = _main_window_feature_text(
+            settings.hotkey_prev,
+            settings.hotkey_next,
+            settings.hotkey_show_history,
+            getattr(settings, "hotkey_qr", "Alt+Shift+Q"),
+            settings.show_preview_overlay,
+            settings.capture_protection_enabled,
+        )
+        if text is not self._feature_text:
+            self._feature_text = text
+            self._feature_label.setText(text)
 
     def _on_minimize_clicked(self) -> None:
         self.showMinimized()
@@ -3300,25 +4075,54 @@ class MainWindow(QtWidgets.QWidget):
     def _close_to_tray(self) -> None:
         self.hide()
 
+    def _drag_press(self, event: QtCore.QEvent) -> bool:
+        if event.button() != QtCore.Qt.LeftButton:
+            return False
+        self._drag_active = True
+        self._drag_offset = self._event_global_pos(event) - self.frameGeometry().topLeft()
+        return True
+
+    def _drag_move(self, event: QtCore.QEvent) -> bool:
+        if not (self._drag_active and event.buttons() & QtCore.Qt.LeftButton):
+            return False
+        self.move(self._event_global_pos(event) - self._drag_offset)
+        return True
+
+    def _drag_release(self, event: QtCore.QEvent) -> bool:
+        if event.button() != QtCore.Qt.LeftButton:
+            return False
+        self._drag_active = False
+        return True
+
+    # event type -> handler for the title bar drag, see eventFilter
+    _DRAG_HANDLERS = {
+        QtCore.QEvent.MouseButtonPress: _drag_press,
+        QtCore.QEvent.MouseMove: _drag_move,
+        QtCore.QEvent.MouseButtonRelease: _drag_release,
+    }
+
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if obj in (self._title_bar, self._title_label, self._title_icon):
-            if event.type() == QtCore.QEvent.MouseButtonPress and event.button() == QtCore.Qt.LeftButton:
-                self._drag_active = True
-                self._drag_offset = self._event_global_pos(event) - self.frameGeometry().topLeft()
-                return True
-            if event.type() == QtCore.QEvent.MouseMove and self._drag_active and event.buttons() & QtCore.Qt.LeftButton:
-                self.move(self._event_global_pos(event) - self._drag_offset)
-                return True
-            if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
-                self._drag_active = False
+        # sees every event of the title bar widgets; paint and hover fall through at once
+        handler = self._DRAG_HANDLERS.get(event.type())
+        if handler is not None and (
+            obj is self._title_bar or obj is self._title_label or obj is self._title_icon
+        ):
+            if handler(self, event):
                 return True
         return super().eventFilter(obj, event)
 
-    @staticmethod
-    def _event_global_pos(event: QtCore.QEvent) -> QtCore.QPoint:
-        if hasattr(event, "globalPosition"):
+    # Qt 6 mouse events expose globalPosition(); Qt 5 only has globalPos()
+    if hasattr(QtGui.QMouseEvent, "globalPosition"):
+
+        @staticmethod
+        def _event_global_pos(event: QtCore.QEvent) -> QtCore.QPoint:
             return event.globalPosition().toPoint()
-        return event.globalPos()
+
+    else:
+
+        @staticmethod
+        def _event_global_pos(event: QtCore.QEvent) -> QtCore.QPoint:
+            return event.globalPos()
 
 
 def main() -> int:
@@ -3328,9 +4132,11 @@ def main() -> int:
     apply_app_theme(app, settings)
     app.setWindowIcon(load_app_icon())
     controller = MainController(app, settings)
-    ensure_autostart(install_target)
     window = MainWindow(controller)
     controller.register_main_window(window)
+    QtCore.QTimer.singleShot(0, controller.warm_up)
+    # the registry write is not needed for this session; let the tray come up first
+    QtCore.QTimer.singleShot(0, functools.partial(ensure_autostart, install_target))
     if settings.first_run:
         window.show()
         controller.mark_first_run_completed()
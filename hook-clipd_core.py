@@ -1,15 +1,22 @@
 hiddenimports = [
+    "array",
     "base64",
+    "functools",
+    "hashlib",
+    "itertools",
     "math",
     "json",
     "os",
+    "pickle",
     "re",
     "shutil",
     "string",
     "sys",
     "time",
+    "weakref",
     "dataclasses",
     "pathlib",
+    "types",
     "typing",
     "ctypes",
     "ctypes.wintypes",
@@ -18,6 +25,7 @@ hiddenimports = [
     "PySide6.QtGui",
     "PySide6.QtWidgets",
     "cryptography.fernet",
+    "orjson",
     # QR code support and backend
     "qrcode",
     "qrcode.image",
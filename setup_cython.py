@@ -1,4 +1,5 @@
 import pathlib
+import sys
 from setuptools import Extension, setup
 from Cython.Build import cythonize
 
@@ -6,10 +7,16 @@ from Cython.Build import cythonize
 MODULE_NAME = "clipd_core"
 SOURCE_FILE = "clipboard_guardian.py"
 
+if sys.platform == "win32":
+    EXTRA_COMPILE_ARGS = ["/O2"]
+else:
+    EXTRA_COMPILE_ARGS = ["-O3", "-fno-plt"]
+
 extensions = [
     Extension(
         MODULE_NAME,
         [SOURCE_FILE],
+        extra_compile_args=EXTRA_COMPILE_ARGS,
     )
 ]
 
@@ -17,6 +24,14 @@ setup(
     name=MODULE_NAME,
     ext_modules=cythonize(
         extensions,
-        compiler_directives={"language_level": "3"},
+        compiler_directives={
+            "language_level": "3",
+            # Qt slots, functools.lru_cache/cached_property and dataclasses need real
+            # function objects; binding=False would break them. boundscheck/wraparound
+            # stay on: without typed buffers they only affect constant list indices
+            # such as items[-1], where turning them off is unsafe.
+            "binding": True,
+            "emit_code_comments": False,
+        },
     ),
 )